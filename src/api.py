@@ -1,6 +1,13 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from anyio import to_thread
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from .database import engine, Base
+from fastapi.responses import JSONResponse
+from psycopg2 import errorcodes
+from sqlalchemy.exc import IntegrityError
+from .database import engine, Base, THREADPOOL_SIZE, verify_foreign_keys, warm_connection_pool
+from .middleware.response_cache import ResponseCacheMiddleware
+from .services.pdf_report_service import ReportNotFoundError
 
 # Import all controllers
 from .controller.auth_controller import router as auth_router
@@ -19,8 +26,24 @@ from .controller.report_controller import router as report_router
 # Create database tables (commented out to avoid connection errors on import)
 # Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A mistyped ForeignKey target should stop startup, not surface on the first join
+    verify_foreign_keys()
+    # Sync endpoints block a thread for each database round-trip; size the threadpool to the connection pool
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Warm the connection pool; the app still starts if the database is not reachable yet
+    try:
+        warm_connection_pool()
+    except Exception as e:
+        print(f"⚠️  Warning: Could not warm the database connection pool: {e}")
+    yield
+    engine.dispose()
+
+
 # Create FastAPI application
 app = FastAPI(
+    lifespan=lifespan,
     title="Cursito API",
     description="REST API for managing courses, workers, surveys, and more",
     version="1.0.0",
@@ -28,6 +51,33 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# Cache read-heavy worker and course endpoints in memory (added before CORS so CORS headers stay per-request)
+# The cache is per process. A write clears only the cache of the process that served it, so with several
+# uvicorn workers the others can serve data up to a policy's TTL old (60s at most), and entries past their
+# TTL are still replayed for stale_ttl (300s) while the handler fails or returns 5xx
+app.add_middleware(
+    ResponseCacheMiddleware,
+    # Login and password changes alter no cached response; they must not flush the cache
+    invalidation_exempt=[r"^/auth/"],
+    ttl_policies=[
+        (r"^/workers/search/", 10),
+        (r"^/workers/?$", 20),
+        (r"^/workers/(email/[^/]+|[0-9a-fA-F-]{36})$", 60),
+        (r"^/workers/", 20),
+        # Course catalogue lists
+        (r"^/courses/search/", 10),
+        (r"^/courses/(period|type|mode|profile)/", 60),
+        (r"^/courses/(active|date-range)/", 60),
+        (r"^/courses/?$", 30),
+        # Periods, surveys and questions change rarely; per-worker answers are left uncached
+        (r"^/(surveys|questions)/search/", 10),
+        (r"^/periods/(active|date-range)/", 60),
+        (r"^/(periods|surveys|questions)/?$", 60),
+        (r"^/(periods|surveys|questions)/[0-9a-fA-F-]{36}$", 60),
+        (r"^/questions/survey/[0-9a-fA-F-]{36}$", 60),
+    ]
+)
+
 #Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -37,6 +87,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Exception handlers shared by all routers
+@app.exception_handler(ReportNotFoundError)
+def report_not_found_handler(request: Request, exc: ReportNotFoundError):
+    return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)})
+
+
+@app.exception_handler(IntegrityError)
+def integrity_error_handler(request: Request, exc: IntegrityError):
+    # Map the PostgreSQL error code: duplicates are conflicts, missing references and values are bad input
+    pgcode = getattr(exc.orig, "pgcode", None)
+    diag = getattr(exc.orig, "diag", None)
+    constraint = getattr(diag, "constraint_name", None)
+    if pgcode == errorcodes.UNIQUE_VIOLATION:
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"detail": "The record already exists", "constraint": constraint}
+        )
+    if pgcode == errorcodes.FOREIGN_KEY_VIOLATION:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": "A referenced record does not exist", "constraint": constraint}
+        )
+    if pgcode == errorcodes.NOT_NULL_VIOLATION:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": "A required value is missing", "column": getattr(diag, "column_name", None)}
+        )
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": "The operation conflicts with existing data", "constraint": constraint}
+    )
+
 # Include all routers
 app.include_router(auth_router)
 app.include_router(department_router)
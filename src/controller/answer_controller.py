@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import PositiveInt
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from ..database import get_db
 from ..dto.answer import Answer, AnswerCreate, AnswerUpdate
 from ..dto.pagination import PaginatedResponse
+from ..middleware.auth_middleware import get_current_worker
+from ..utils.auth import CachedWorker
+from ..utils.pagination import after_cursor, next_cursor
 from ..repository.answer_repository import AnswerRepository
 
 router = APIRouter(prefix="/answers", tags=["answers"])
@@ -14,8 +17,8 @@ answer_repo = AnswerRepository()
 
 
 @router.get("/", response_model=PaginatedResponse[Answer])
-def get_answers(page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    answers, total_pages, total_count = answer_repo.get_multi_paginated(db, page=page, limit=limit)
+def get_answers(page: PositiveInt = 1, limit: int = 100, current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    answers, total_pages, total_count = answer_repo.get_multi_paginated(db, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=answers,
         total_pages=total_pages,
@@ -25,8 +28,8 @@ def get_answers(page: PositiveInt = 1, limit: int = 100, db: Session = Depends(g
 
 
 @router.get("/{answer_id}", response_model=Answer)
-def get_answer(answer_id: UUID, db: Session = Depends(get_db)):
-    answer = answer_repo.get(db, id=answer_id)
+def get_answer(answer_id: UUID, current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    answer = answer_repo.get_visible(db, id=answer_id, worker=current_worker)
     if not answer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -37,20 +40,15 @@ def get_answer(answer_id: UUID, db: Session = Depends(get_db)):
 
 @router.post("/", response_model=Answer, status_code=status.HTTP_201_CREATED)
 def create_answer(answer: AnswerCreate, db: Session = Depends(get_db)):
-    # Check if answer already exists for this worker, course, and question
-    existing_answer = answer_repo.get_by_worker_course_and_question(
-        db, 
-        worker_id=answer.worker_id, 
-        course_id=answer.course_id, 
-        question_id=answer.question_id
-    )
-    if existing_answer:
+    # Insert only if this worker has not answered the question in the course (atomic, single round-trip)
+    new_answer = answer_repo.create_if_absent(db, obj_in=answer)
+    if not new_answer:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Answer already exists for this worker, course, and question"
         )
-    
-    return answer_repo.create(db, obj_in=answer)
+
+    return new_answer
 
 
 @router.put("/{answer_id}", response_model=Answer)
@@ -70,13 +68,13 @@ def update_answer(
     worker_id = answer_update.worker_id or answer.worker_id
     course_id = answer_update.course_id or answer.course_id
     question_id = answer_update.question_id or answer.question_id
-    existing_answer = answer_repo.get_by_worker_course_and_question(
-        db, 
-        worker_id=worker_id, 
-        course_id=course_id, 
-        question_id=question_id
-    )
-    if existing_answer and existing_answer.id != answer_id:
+    if answer_repo.exists_by_worker_course_and_question(
+        db,
+        worker_id=worker_id,
+        course_id=course_id,
+        question_id=question_id,
+        exclude_id=answer_id
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Answer already exists for this worker, course, and question"
@@ -97,30 +95,38 @@ def delete_answer(answer_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/worker/{worker_id}", response_model=PaginatedResponse[Answer])
-def get_answers_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    answers, total_pages, total_count = answer_repo.get_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit)
+def get_answers_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    if after_id is not None:
+        answers, total_pages, total_count = answer_repo.get_by_worker_after(db, worker_id=worker_id, after=after_id, limit=limit, worker=current_worker)
+    else:
+        answers, total_pages, total_count = answer_repo.get_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=answers,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(answers, limit)
     )
 
 
 @router.get("/course/{course_id}", response_model=PaginatedResponse[Answer])
-def get_answers_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    answers, total_pages, total_count = answer_repo.get_by_course_paginated(db, course_id=course_id, page=page, limit=limit)
+def get_answers_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    if after_id is not None:
+        answers, total_pages, total_count = answer_repo.get_by_course_after(db, course_id=course_id, after=after_id, limit=limit, worker=current_worker)
+    else:
+        answers, total_pages, total_count = answer_repo.get_by_course_paginated(db, course_id=course_id, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=answers,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(answers, limit)
     )
 
 
 @router.get("/question/{question_id}", response_model=PaginatedResponse[Answer])
-def get_answers_by_question(question_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    answers, total_pages, total_count = answer_repo.get_by_question_paginated(db, question_id=question_id, page=page, limit=limit)
+def get_answers_by_question(question_id: UUID, page: PositiveInt = 1, limit: int = 100, current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    answers, total_pages, total_count = answer_repo.get_by_question_paginated(db, question_id=question_id, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=answers,
         total_pages=total_pages,
@@ -135,9 +141,10 @@ def get_answers_by_worker_and_course(
     course_id: UUID,
     page: PositiveInt = 1,
     limit: int = 100,
+    current_worker: CachedWorker = Depends(get_current_worker),
     db: Session = Depends(get_db)
 ):
-    answers, total_pages, total_count = answer_repo.get_by_worker_and_course_paginated(db, worker_id=worker_id, course_id=course_id, page=page, limit=limit)
+    answers, total_pages, total_count = answer_repo.get_by_worker_and_course_paginated(db, worker_id=worker_id, course_id=course_id, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=answers,
         total_pages=total_pages,
@@ -147,8 +154,8 @@ def get_answers_by_worker_and_course(
 
 
 @router.get("/survey/{survey_id}", response_model=PaginatedResponse[Answer])
-def get_answers_by_survey(survey_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    answers, total_pages, total_count = answer_repo.get_by_survey_paginated(db, survey_id=survey_id, page=page, limit=limit)
+def get_answers_by_survey(survey_id: UUID, page: PositiveInt = 1, limit: int = 100, current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    answers, total_pages, total_count = answer_repo.get_by_survey_paginated(db, survey_id=survey_id, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=answers,
         total_pages=total_pages,
@@ -158,8 +165,21 @@ def get_answers_by_survey(survey_id: UUID, page: PositiveInt = 1, limit: int = 1
 
 
 @router.get("/search/{value}", response_model=PaginatedResponse[Answer])
-def search_answers(value: str, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    answers, total_pages, total_count = answer_repo.search_by_value_paginated(db, value=value, page=page, limit=limit)
+def search_answers(
+    value: str,
+    page: PositiveInt = 1,
+    limit: int = 100,
+    min_similarity: Optional[float] = Query(None, ge=0, le=1),
+    current_worker: CachedWorker = Depends(get_current_worker),
+    db: Session = Depends(get_db)
+):
+    """
+    Answers containing `value`, most similar first.
+    With `min_similarity` (0-1), fuzzy-match by trigram similarity instead of substring.
+    """
+    answers, total_pages, total_count = answer_repo.search_by_value_paginated(
+        db, value=value, page=page, limit=limit, min_similarity=min_similarity, worker=current_worker
+    )
     return PaginatedResponse(
         items=answers,
         total_pages=total_pages,
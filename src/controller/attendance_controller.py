@@ -1,24 +1,30 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import PositiveInt
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from datetime import date
 
 from ..database import get_db
 from ..dto.attendance import Attendance, AttendanceCreate, AttendanceUpdate, BulkAttendanceCreate, BulkAttendanceResponse
+from ..dto.bulk import BulkError, BulkErrorCode
 from ..dto.pagination import PaginatedResponse
+from ..middleware.auth_middleware import get_current_worker
+from ..utils.auth import CachedWorker
+from ..utils.pagination import after_cursor, next_cursor
 from ..repository.attendance_repository import AttendanceRepository
 from ..repository.course_repository import CourseRepository
+from ..repository.worker_repository import WorkerRepository
 
 router = APIRouter(prefix="/attendances", tags=["attendances"])
 attendance_repo = AttendanceRepository()
 course_repo = CourseRepository()
+worker_repo = WorkerRepository()
 
 
 @router.get("/", response_model=PaginatedResponse[Attendance])
-def get_attendances(page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    attendances, total_pages, total_count = attendance_repo.get_multi_paginated(db, page=page, limit=limit)
+def get_attendances(page: PositiveInt = 1, limit: int = 100, current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    attendances, total_pages, total_count = attendance_repo.get_multi_paginated(db, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=attendances,
         total_pages=total_pages,
@@ -28,8 +34,8 @@ def get_attendances(page: PositiveInt = 1, limit: int = 100, db: Session = Depen
 
 
 @router.get("/{attendance_id}", response_model=Attendance)
-def get_attendance(attendance_id: UUID, db: Session = Depends(get_db)):
-    attendance = attendance_repo.get(db, id=attendance_id)
+def get_attendance(attendance_id: UUID, current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    attendance = attendance_repo.get_visible(db, id=attendance_id, worker=current_worker)
     if not attendance:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -40,20 +46,15 @@ def get_attendance(attendance_id: UUID, db: Session = Depends(get_db)):
 
 @router.post("/", response_model=Attendance, status_code=status.HTTP_201_CREATED)
 def create_attendance(attendance: AttendanceCreate, db: Session = Depends(get_db)):
-    # Check if attendance already exists for this worker, course, and date
-    existing_attendance = attendance_repo.get_by_worker_course_and_date(
-        db, 
-        worker_id=attendance.worker_id, 
-        course_id=attendance.course_id, 
-        attendance_date=attendance.date
-    )
-    if existing_attendance:
+    # Insert only if no attendance is recorded for this worker, course, and date (atomic, single round-trip)
+    new_attendance = attendance_repo.create_if_absent(db, obj_in=attendance)
+    if not new_attendance:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Attendance already recorded for this worker, course, and date"
         )
-    
-    return attendance_repo.create(db, obj_in=attendance)
+
+    return new_attendance
 
 
 @router.put("/{attendance_id}", response_model=Attendance)
@@ -72,14 +73,14 @@ def update_attendance(
     # Check if new assignment conflicts with existing attendance
     worker_id = attendance_update.worker_id or attendance.worker_id
     course_id = attendance_update.course_id or attendance.course_id
-    attendance_date = attendance_update.date or attendance.date
-    existing_attendance = attendance_repo.get_by_worker_course_and_date(
-        db, 
-        worker_id=worker_id, 
-        course_id=course_id, 
-        attendance_date=attendance_date
-    )
-    if existing_attendance and existing_attendance.id != attendance_id:
+    attendance_date = attendance_update.date or attendance.attendance_date
+    if attendance_repo.exists_by_worker_course_and_date(
+        db,
+        worker_id=worker_id,
+        course_id=course_id,
+        attendance_date=attendance_date,
+        exclude_id=attendance_id
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Attendance already recorded for this worker, course, and date"
@@ -100,24 +101,32 @@ def delete_attendance(attendance_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/worker/{worker_id}", response_model=PaginatedResponse[Attendance])
-def get_attendances_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    attendances, total_pages, total_count = attendance_repo.get_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit)
+def get_attendances_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    if after_id is not None:
+        attendances, total_pages, total_count = attendance_repo.get_by_worker_after(db, worker_id=worker_id, after=after_id, limit=limit, worker=current_worker)
+    else:
+        attendances, total_pages, total_count = attendance_repo.get_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=attendances,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(attendances, limit)
     )
 
 
 @router.get("/course/{course_id}", response_model=PaginatedResponse[Attendance])
-def get_attendances_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    attendances, total_pages, total_count = attendance_repo.get_by_course_paginated(db, course_id=course_id, page=page, limit=limit)
+def get_attendances_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    if after_id is not None:
+        attendances, total_pages, total_count = attendance_repo.get_by_course_after(db, course_id=course_id, after=after_id, limit=limit, worker=current_worker)
+    else:
+        attendances, total_pages, total_count = attendance_repo.get_by_course_paginated(db, course_id=course_id, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=attendances,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(attendances, limit)
     )
 
 
@@ -127,9 +136,10 @@ def get_attendances_by_worker_and_course(
     course_id: UUID,
     page: PositiveInt = 1,
     limit: int = 100,
+    current_worker: CachedWorker = Depends(get_current_worker),
     db: Session = Depends(get_db)
 ):
-    attendances, total_pages, total_count = attendance_repo.get_by_worker_and_course_paginated(db, worker_id=worker_id, course_id=course_id, page=page, limit=limit)
+    attendances, total_pages, total_count = attendance_repo.get_by_worker_and_course_paginated(db, worker_id=worker_id, course_id=course_id, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=attendances,
         total_pages=total_pages,
@@ -139,8 +149,8 @@ def get_attendances_by_worker_and_course(
 
 
 @router.get("/date/{attendance_date}", response_model=PaginatedResponse[Attendance])
-def get_attendances_by_date(attendance_date: date, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    attendances, total_pages, total_count = attendance_repo.get_by_date_paginated(db, attendance_date=attendance_date, page=page, limit=limit)
+def get_attendances_by_date(attendance_date: date, page: PositiveInt = 1, limit: int = 100, current_worker: CachedWorker = Depends(get_current_worker), db: Session = Depends(get_db)):
+    attendances, total_pages, total_count = attendance_repo.get_by_date_paginated(db, attendance_date=attendance_date, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=attendances,
         total_pages=total_pages,
@@ -165,6 +175,7 @@ def get_attendances_by_date_range(
     end_date: date,
     page: PositiveInt = 1,
     limit: int = 100,
+    current_worker: CachedWorker = Depends(get_current_worker),
     db: Session = Depends(get_db)
 ):
     if start_date > end_date:
@@ -172,7 +183,7 @@ def get_attendances_by_date_range(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Start date must be before or equal to end date"
         )
-    attendances, total_pages, total_count = attendance_repo.get_date_range_paginated(db, start_date=start_date, end_date=end_date, page=page, limit=limit)
+    attendances, total_pages, total_count = attendance_repo.get_date_range_paginated(db, start_date=start_date, end_date=end_date, page=page, limit=limit, worker=current_worker)
     return PaginatedResponse(
         items=attendances,
         total_pages=total_pages,
@@ -201,37 +212,34 @@ def create_bulk_attendances(
             detail=f"Attendance date must be between course start date ({course.start_date}) and end date ({course.end_date})"
         )
 
-    created = 0
-    skipped = 0
     errors = []
 
+    # Unknown workers would fail the foreign key; report them instead of inserting
+    existing_ids = worker_repo.get_existing_ids(db, bulk_data.worker_ids)
+    to_create = []
+    seen = set()
     for worker_id in bulk_data.worker_ids:
-        try:
-            # Check if attendance already exists
-            existing_attendance = attendance_repo.get_by_worker_course_and_date(
-                db,
-                worker_id=worker_id,
-                course_id=bulk_data.course_id,
-                attendance_date=bulk_data.date
-            )
-
-            if existing_attendance:
-                skipped += 1
-                errors.append(f"Attendance already exists for worker {worker_id}")
-                continue
-
-            # Create attendance
-            attendance_create = AttendanceCreate(
-                worker_id=worker_id,
-                course_id=bulk_data.course_id,
-                attendance_date=bulk_data.date
-            )
-            attendance_repo.create(db, obj_in=attendance_create)
-            created += 1
-
-        except Exception as e:
-            skipped += 1
-            errors.append(f"Error creating attendance for worker {worker_id}: {str(e)}")
+        if worker_id not in existing_ids:
+            errors.append(BulkError(code=BulkErrorCode.WORKER_NOT_FOUND, worker_id=worker_id))
+        elif worker_id in seen:
+            errors.append(BulkError(code=BulkErrorCode.DUPLICATE_WORKER, worker_id=worker_id))
+        else:
+            seen.add(worker_id)
+            to_create.append(worker_id)
+
+    # Insert all attendances at once; existing ones are skipped by the unique constraint
+    created_ids = set(attendance_repo.bulk_create(
+        db,
+        course_id=bulk_data.course_id,
+        attendance_date=bulk_data.date,
+        worker_ids=to_create
+    ))
+    for worker_id in to_create:
+        if worker_id not in created_ids:
+            errors.append(BulkError(code=BulkErrorCode.ATTENDANCE_EXISTS, worker_id=worker_id))
+
+    created = len(created_ids)
+    skipped = len(errors)
 
     return BulkAttendanceResponse(
         created=created,
@@ -9,15 +9,16 @@ from src.utils.auth import (
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
-from src.middleware.auth_middleware import get_current_worker
+from src.middleware.auth_middleware import get_current_worker_record
 from src.model.worker import Worker
-from ..dto.worker import WorkerUpdate
+from ..dto.worker import Worker as WorkerDTO
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
+worker_repo = WorkerRepository()
 
 
 @router.post("/login", response_model=TokenResponse, status_code=status.HTTP_200_OK)
-async def login(
+def login(
     login_data: LoginRequest,
     db: Session = Depends(get_db)
 ):
@@ -29,8 +30,6 @@ async def login(
 
     Retorna un token JWT válido por 30 minutos (configurable)
     """
-    worker_repo = WorkerRepository()
-
     # Buscar el worker por email
     worker = worker_repo.get_by_email(db, login_data.email)
 
@@ -72,9 +71,9 @@ async def login(
 
 
 @router.post("/change-password", status_code=status.HTTP_200_OK)
-async def change_password(
+def change_password(
     password_data: ChangePasswordRequest,
-    current_worker: Worker = Depends(get_current_worker),
+    current_worker: Worker = Depends(get_current_worker_record),
     db: Session = Depends(get_db)
 ):
     """
@@ -99,19 +98,17 @@ async def change_password(
             detail="La contraseña actual es incorrecta"
         )
 
-    # Actualizar la contraseña
-    worker_repo = WorkerRepository()
-    current_worker.password = get_password_hash(password_data.new_password)
-    worker_repo.update(db,current_worker, WorkerUpdate(password=password_data.new_password))
+    # Actualizar la contraseña; se pasa por update para que el cambio se detecte y se confirme
+    worker_repo.update(db, current_worker, {"password": get_password_hash(password_data.new_password)})
 
     return {
         "message": "Contraseña actualizada exitosamente"
     }
 
 
-@router.get("/me", status_code=status.HTTP_200_OK)
+@router.get("/me", response_model=WorkerDTO, status_code=status.HTTP_200_OK)
 async def get_current_user_info(
-    current_worker: Worker = Depends(get_current_worker)
+    current_worker: Worker = Depends(get_current_worker_record)
 ):
     """
     Endpoint para obtener información del usuario autenticado
@@ -120,16 +117,5 @@ async def get_current_user_info(
 
     Retorna los datos del trabajador actualmente autenticado
     """
-    return {
-        "id": str(current_worker.id),
-        "email": current_worker.email,
-        "name": current_worker.name,
-        "father_surname": current_worker.father_surname,
-        "mother_surname": current_worker.mother_surname,
-        "position": current_worker.position,
-        "department_id": str(current_worker.department_id) if current_worker.department_id else None,
-        "rfc": current_worker.rfc,
-        "curp": current_worker.curp,
-        "sex": current_worker.sex,
-        "telephone": current_worker.telephone
-    }
+    # El response_model serializa directamente a JSON con pydantic-core (sin password)
+    return current_worker
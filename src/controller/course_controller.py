@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import PositiveInt
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from datetime import date, timedelta
 
@@ -10,6 +10,7 @@ from ..dto.course import Course, CourseCreate, CourseUpdate
 from ..dto.worker import Worker
 from ..dto.enrolling import Enrolling
 from ..dto.pagination import PaginatedResponse
+from ..utils.pagination import after_cursor, next_cursor
 from ..dto.attendance import AttendanceList
 from ..repository.course_repository import CourseRepository
 from ..repository.instructor_repository import InstructorRepository
@@ -51,13 +52,17 @@ def validate_course_duration_and_weekdays(start_date: date, end_date: date):
 
 
 @router.get("/", response_model=PaginatedResponse[Course])
-def get_courses(page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    courses, total_pages, total_count = course_repo.get_multi_paginated(db, page=page, limit=limit)
+def get_courses(page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        courses, total_pages, total_count = course_repo.get_multi_after(db, after=after_id, limit=limit)
+    else:
+        courses, total_pages, total_count = course_repo.get_multi_paginated(db, page=page, limit=limit)
     return PaginatedResponse(
         items=courses,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(courses, limit)
     )
 
 
@@ -259,13 +264,17 @@ def delete_course(course_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/period/{period_id}", response_model=PaginatedResponse[Course])
-def get_courses_by_period(period_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    courses, total_pages, total_count = course_repo.get_by_period_paginated(db, period_id=period_id, page=page, limit=limit)
+def get_courses_by_period(period_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        courses, total_pages, total_count = course_repo.get_by_period_after(db, period_id=period_id, after=after_id, limit=limit)
+    else:
+        courses, total_pages, total_count = course_repo.get_by_period_paginated(db, period_id=period_id, page=page, limit=limit)
     return PaginatedResponse(
         items=courses,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(courses, limit)
     )
 
 
@@ -357,7 +366,7 @@ def get_instructors(course_id: UUID, page: PositiveInt = 1, limit: int = 100, db
             detail="Course not found"
         )
     
-    instructors, total_pages, total_count = course_repo.get_instructors(db, course_id)
+    instructors, total_pages, total_count = course_repo.get_instructors(db, course_id, page=page, limit=limit)
     return PaginatedResponse(
         items=instructors,
         total_pages=total_pages,
@@ -375,7 +384,7 @@ def get_enrolled_workers(course_id: UUID,  page: PositiveInt = 1, limit: int = 1
             detail="Course not found"
         )
 
-    enrollments, total_pages, total_count = course_repo.get_enrolled_workers(db, course_id)
+    enrollments, total_pages, total_count = course_repo.get_enrolled_workers(db, course_id, page=page, limit=limit)
     return PaginatedResponse(
         items=enrollments,
         total_pages=total_pages,
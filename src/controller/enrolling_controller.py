@@ -1,32 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import PositiveInt
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from decimal import Decimal
 
 from ..database import get_db
 from ..dto.enrolling import Enrolling, EnrollingCreate, EnrollingUpdate, BulkGradeUpdate, BulkGradeResponse
+from ..dto.bulk import BulkError, BulkErrorCode
 from ..dto.pagination import PaginatedResponse
+from ..utils.pagination import after_cursor, next_cursor
 from ..repository.enrolling_repository import EnrollingRepository
 from ..repository.course_repository import CourseRepository
 from ..repository.worker_repository import WorkerRepository
-from ..model.instructor import Instructor
+from ..repository.instructor_repository import InstructorRepository
 
 router = APIRouter(prefix="/enrollings", tags=["enrollings"])
 enrolling_repo = EnrollingRepository()
 course_repo = CourseRepository()
 worker_repo = WorkerRepository()
+instructor_repo = InstructorRepository()
 
 
 @router.get("/", response_model=PaginatedResponse[Enrolling])
-def get_enrollings(page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    enrollings, total_pages, total_count = enrolling_repo.get_multi_paginated(db, page=page, limit=limit)
+def get_enrollings(page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        enrollings, total_pages, total_count = enrolling_repo.get_multi_after(db, after=after_id, limit=limit)
+    else:
+        enrollings, total_pages, total_count = enrolling_repo.get_multi_paginated(db, page=page, limit=limit)
     return PaginatedResponse(
         items=enrollings,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(enrollings, limit)
     )
 
 
@@ -60,21 +67,14 @@ def create_enrolling(enrolling: EnrollingCreate, db: Session = Depends(get_db)):
         )
 
     # Check if worker is an instructor of this course
-    is_instructor = db.query(Instructor).filter(
-        Instructor.worker_id == enrolling.worker_id,
-        Instructor.course_id == enrolling.course_id
-    ).first()
-    if is_instructor:
+    if instructor_repo.exists_by_worker_and_course(db, worker_id=enrolling.worker_id, course_id=enrolling.course_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="An instructor cannot enroll in a course they are teaching"
         )
 
     # Check if worker is already enrolled in this course
-    existing_enrolling = enrolling_repo.get_by_worker_and_course(
-        db, worker_id=enrolling.worker_id, course_id=enrolling.course_id
-    )
-    if existing_enrolling:
+    if enrolling_repo.exists_by_worker_and_course(db, worker_id=enrolling.worker_id, course_id=enrolling.course_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Worker is already enrolled in this course"
@@ -129,21 +129,14 @@ def update_enrolling(
             )
 
     # Check if worker is an instructor of the course (new or existing)
-    is_instructor = db.query(Instructor).filter(
-        Instructor.worker_id == worker_id,
-        Instructor.course_id == course_id
-    ).first()
-    if is_instructor:
+    if instructor_repo.exists_by_worker_and_course(db, worker_id=worker_id, course_id=course_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="An instructor cannot enroll in a course they are teaching"
         )
 
     # Check if new assignment conflicts with existing enrolling
-    existing_enrolling = enrolling_repo.get_by_worker_and_course(
-        db, worker_id=worker_id, course_id=course_id
-    )
-    if existing_enrolling and existing_enrolling.id != enrolling_id:
+    if enrolling_repo.exists_by_worker_and_course(db, worker_id=worker_id, course_id=course_id, exclude_id=enrolling_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Worker is already enrolled in this course"
@@ -175,24 +168,32 @@ def delete_enrolling(enrolling_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/worker/{worker_id}", response_model=PaginatedResponse[Enrolling])
-def get_enrollings_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    enrollings, total_pages, total_count = enrolling_repo.get_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit)
+def get_enrollings_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        enrollings, total_pages, total_count = enrolling_repo.get_by_worker_after(db, worker_id=worker_id, after=after_id, limit=limit)
+    else:
+        enrollings, total_pages, total_count = enrolling_repo.get_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit)
     return PaginatedResponse(
         items=enrollings,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(enrollings, limit)
     )
 
 
 @router.get("/course/{course_id}", response_model=PaginatedResponse[Enrolling])
-def get_enrollings_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    enrollings, total_pages, total_count = enrolling_repo.get_by_course_paginated(db, course_id=course_id, page=page, limit=limit)
+def get_enrollings_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        enrollings, total_pages, total_count = enrolling_repo.get_by_course_after(db, course_id=course_id, after=after_id, limit=limit)
+    else:
+        enrollings, total_pages, total_count = enrolling_repo.get_by_course_paginated(db, course_id=course_id, page=page, limit=limit)
     return PaginatedResponse(
         items=enrollings,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(enrollings, limit)
     )
 
 
@@ -231,38 +232,26 @@ def update_bulk_grades(
             detail="Course not found"
         )
 
-    updated = 0
-    skipped = 0
     errors = []
 
+    # Validate grade range (0-100); the first grade given for a worker wins, repeats are reported
+    grades = {}
     for grade_data in bulk_data.grades:
-        try:
-            # Validate grade range (0-100)
-            if grade_data.final_grade < 0 or grade_data.final_grade > 100:
-                skipped += 1
-                errors.append(f"Grade for worker {grade_data.worker_id} must be between 0 and 100")
-                continue
-
-            # Find the enrollment
-            enrolling = enrolling_repo.get_by_worker_and_course(
-                db,
-                worker_id=grade_data.worker_id,
-                course_id=bulk_data.course_id
-            )
-
-            if not enrolling:
-                skipped += 1
-                errors.append(f"Worker {grade_data.worker_id} is not enrolled in this course")
-                continue
-
-            # Update the grade
-            enrolling_update = EnrollingUpdate(final_grade=grade_data.final_grade)
-            enrolling_repo.update(db, db_obj=enrolling, obj_in=enrolling_update)
-            updated += 1
-
-        except Exception as e:
-            skipped += 1
-            errors.append(f"Error updating grade for worker {grade_data.worker_id}: {str(e)}")
+        if grade_data.final_grade < 0 or grade_data.final_grade > 100:
+            errors.append(BulkError(code=BulkErrorCode.GRADE_OUT_OF_RANGE, worker_id=grade_data.worker_id))
+        elif grade_data.worker_id in grades:
+            errors.append(BulkError(code=BulkErrorCode.DUPLICATE_WORKER, worker_id=grade_data.worker_id))
+        else:
+            grades[grade_data.worker_id] = grade_data.final_grade
+
+    # Update every enrollment in one statement; workers not enrolled match no row
+    updated_ids = set(enrolling_repo.bulk_update_grades(db, course_id=bulk_data.course_id, grades=grades))
+    for worker_id in grades:
+        if worker_id not in updated_ids:
+            errors.append(BulkError(code=BulkErrorCode.NOT_ENROLLED, worker_id=worker_id))
+
+    updated = len(updated_ids)
+    skipped = len(errors)
 
     return BulkGradeResponse(
         updated=updated,
@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import PositiveInt
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from ..database import get_db
 from ..dto.instructor import Instructor, InstructorCreate, InstructorUpdate
 from ..dto.pagination import PaginatedResponse
+from ..utils.pagination import after_cursor, next_cursor
 from ..repository.instructor_repository import InstructorRepository
 
 router = APIRouter(prefix="/instructors", tags=["instructors"])
@@ -14,13 +15,17 @@ instructor_repo = InstructorRepository()
 
 
 @router.get("/", response_model=PaginatedResponse[Instructor])
-def get_instructors(page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    instructors, total_pages, total_count = instructor_repo.get_multi_paginated(db, page=page, limit=limit)
+def get_instructors(page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        instructors, total_pages, total_count = instructor_repo.get_multi_after(db, after=after_id, limit=limit)
+    else:
+        instructors, total_pages, total_count = instructor_repo.get_multi_paginated(db, page=page, limit=limit)
     return PaginatedResponse(
         items=instructors,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(instructors, limit)
     )
 
 
@@ -38,10 +43,9 @@ def get_instructor(instructor_id: UUID, db: Session = Depends(get_db)):
 @router.post("/", response_model=Instructor, status_code=status.HTTP_201_CREATED)
 def create_instructor(instructor: InstructorCreate, db: Session = Depends(get_db)):
     # Check if instructor already exists for this course
-    existing_instructor = instructor_repo.get_by_worker_and_course(
+    if instructor_repo.exists_by_worker_and_course(
         db, worker_id=instructor.worker_id, course_id=instructor.course_id
-    )
-    if existing_instructor:
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Instructor already assigned to this course"
@@ -66,10 +70,9 @@ def update_instructor(
     # Check if new assignment conflicts with existing instructor
     worker_id = instructor_update.worker_id or instructor.worker_id
     course_id = instructor_update.course_id or instructor.course_id
-    existing_instructor = instructor_repo.get_by_worker_and_course(
-        db, worker_id=worker_id, course_id=course_id
-    )
-    if existing_instructor and existing_instructor.id != instructor_id:
+    if instructor_repo.exists_by_worker_and_course(
+        db, worker_id=worker_id, course_id=course_id, exclude_id=instructor_id
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Instructor already assigned to this course"
@@ -90,44 +93,60 @@ def delete_instructor(instructor_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/worker/{worker_id}", response_model=PaginatedResponse[Instructor])
-def get_instructors_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    instructors, total_pages, total_count = instructor_repo.get_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit)
+def get_instructors_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        instructors, total_pages, total_count = instructor_repo.get_by_worker_after(db, worker_id=worker_id, after=after_id, limit=limit)
+    else:
+        instructors, total_pages, total_count = instructor_repo.get_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit)
     return PaginatedResponse(
         items=instructors,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(instructors, limit)
     )
 
 
 @router.get("/course/{course_id}", response_model=PaginatedResponse[Instructor])
-def get_instructors_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    instructors, total_pages, total_count = instructor_repo.get_by_course_paginated(db, course_id=course_id, page=page, limit=limit)
+def get_instructors_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        instructors, total_pages, total_count = instructor_repo.get_by_course_after(db, course_id=course_id, after=after_id, limit=limit)
+    else:
+        instructors, total_pages, total_count = instructor_repo.get_by_course_paginated(db, course_id=course_id, page=page, limit=limit)
     return PaginatedResponse(
         items=instructors,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(instructors, limit)
     )
 
 
 @router.get("/worker/{worker_id}/courses", response_model=PaginatedResponse[Instructor])
-def get_courses_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    instructors, total_pages, total_count = instructor_repo.get_courses_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit)
+def get_courses_by_worker(worker_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        instructors, total_pages, total_count = instructor_repo.get_by_worker_after(db, worker_id=worker_id, after=after_id, limit=limit)
+    else:
+        instructors, total_pages, total_count = instructor_repo.get_courses_by_worker_paginated(db, worker_id=worker_id, page=page, limit=limit)
     return PaginatedResponse(
         items=instructors,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(instructors, limit)
     )
 
 
 @router.get("/course/{course_id}/workers", response_model=PaginatedResponse[Instructor])
-def get_workers_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
-    instructors, total_pages, total_count = instructor_repo.get_workers_by_course_paginated(db, course_id=course_id, page=page, limit=limit)
+def get_workers_by_course(course_id: UUID, page: PositiveInt = 1, limit: int = 100, after_id: Optional[UUID] = Depends(after_cursor), db: Session = Depends(get_db)):
+    if after_id is not None:
+        instructors, total_pages, total_count = instructor_repo.get_by_course_after(db, course_id=course_id, after=after_id, limit=limit)
+    else:
+        instructors, total_pages, total_count = instructor_repo.get_workers_by_course_paginated(db, course_id=course_id, page=page, limit=limit)
     return PaginatedResponse(
         items=instructors,
         total_pages=total_pages,
         page=page,
-        total_count=total_count
+        total_count=total_count,
+        next_cursor=next_cursor(instructors, limit)
     )
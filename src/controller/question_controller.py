@@ -37,15 +37,15 @@ def get_question(question_id: UUID, db: Session = Depends(get_db)):
 
 @router.post("/", response_model=Question, status_code=status.HTTP_201_CREATED)
 def create_question(question: QuestionCreate, db: Session = Depends(get_db)):
-    # Check if position already exists for this survey
-    existing_question = question_repo.get_by_order(db, survey_id=question.survey_id, question_order=question.question_order)
-    if existing_question:
+    # Insert only if the position is free for this survey (atomic, single round-trip)
+    new_question = question_repo.create_if_order_free(db, obj_in=question)
+    if not new_question:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Question with this position already exists for this survey"
         )
-    
-    return question_repo.create(db, obj_in=question)
+
+    return new_question
 
 
 @router.put("/{question_id}", response_model=Question)
@@ -2,7 +2,7 @@
 Report Controller
 Handles PDF report generation endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
@@ -10,6 +10,7 @@ from uuid import UUID
 from ..database import get_db
 from ..services.pdf_report_service import PDFReportService
 
+# Missing course/worker/enrollment errors are mapped to 404 by the handler in api.py
 router = APIRouter(prefix="/reports", tags=["Reports"])
 pdf_service = PDFReportService()
 
@@ -26,20 +27,15 @@ def download_attendance_list(
     - Course information
     - List of enrolled workers with attendance per day
     """
-    try:
-        pdf_buffer = pdf_service.generate_attendance_list(db, course_id)
-
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=attendance_list_{course_id}.pdf"
-            }
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
+    pdf_buffer = pdf_service.generate_attendance_list(db, course_id)
+
+    return StreamingResponse(
+        pdf_buffer,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename=attendance_list_{course_id}.pdf"
+        }
+    )
 
 
 @router.get("/grades/{course_id}")
@@ -54,20 +50,15 @@ def download_grades_list(
     - Course information
     - List of enrolled workers with RFC, gender, and final grades
     """
-    try:
-        pdf_buffer = pdf_service.generate_grades_list(db, course_id)
-
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=grades_list_{course_id}.pdf"
-            }
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
+    pdf_buffer = pdf_service.generate_grades_list(db, course_id)
+
+    return StreamingResponse(
+        pdf_buffer,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename=grades_list_{course_id}.pdf"
+        }
+    )
 
 
 @router.get("/enrollment/{worker_id}/{course_id}")
@@ -84,20 +75,15 @@ def download_enrollment_certificate(
     - Course information
     - Enrollment date
     """
-    try:
-        pdf_buffer = pdf_service.generate_enrollment_certificate(db, worker_id, course_id)
-
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=enrollment_certificate_{worker_id}_{course_id}.pdf"
-            }
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
+    pdf_buffer = pdf_service.generate_enrollment_certificate(db, worker_id, course_id)
+
+    return StreamingResponse(
+        pdf_buffer,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename=enrollment_certificate_{worker_id}_{course_id}.pdf"
+        }
+    )
 
 
 @router.get("/instructor-courses/{worker_id}")
@@ -112,20 +98,15 @@ def download_instructor_courses_list(
     - Instructor information
     - All courses taught with full details
     """
-    try:
-        pdf_buffer = pdf_service.generate_instructor_courses_list(db, worker_id)
-
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=instructor_courses_{worker_id}.pdf"
-            }
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
+    pdf_buffer = pdf_service.generate_instructor_courses_list(db, worker_id)
+
+    return StreamingResponse(
+        pdf_buffer,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename=instructor_courses_{worker_id}.pdf"
+        }
+    )
 
 
 @router.get("/survey/{worker_id}/{course_id}/followup")
@@ -141,20 +122,15 @@ def download_followup_survey_responses(
     - Worker and course information
     - All follow-up survey responses
     """
-    try:
-        pdf_buffer = pdf_service.generate_survey_responses(db, worker_id, course_id, 'followup')
-
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=followup_survey_{worker_id}_{course_id}.pdf"
-            }
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
+    pdf_buffer = pdf_service.generate_survey_responses(db, worker_id, course_id, 'followup')
+
+    return StreamingResponse(
+        pdf_buffer,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename=followup_survey_{worker_id}_{course_id}.pdf"
+        }
+    )
 
 
 @router.get("/survey/{worker_id}/{course_id}/opinion")
@@ -170,17 +146,12 @@ def download_opinion_survey_responses(
     - Worker and course information
     - All opinion survey responses
     """
-    try:
-        pdf_buffer = pdf_service.generate_survey_responses(db, worker_id, course_id, 'opinion')
-
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=opinion_survey_{worker_id}_{course_id}.pdf"
-            }
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
+    pdf_buffer = pdf_service.generate_survey_responses(db, worker_id, course_id, 'opinion')
+
+    return StreamingResponse(
+        pdf_buffer,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename=opinion_survey_{worker_id}_{course_id}.pdf"
+        }
+    )
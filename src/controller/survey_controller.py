@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import PositiveInt
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import PositiveInt, TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
 from typing import List
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from ..database import get_db
 from ..dto.survey import Survey, SurveyCreate, SurveyUpdate
-from ..dto.answer import Answer, SurveyAnswersSubmit, AnswerCreate
+from ..dto.answer import Answer, SurveyAnswersSubmit
 from ..dto.pagination import PaginatedResponse
+from ..middleware.auth_middleware import get_current_worker
+from ..utils.auth import CachedWorker
 from ..repository.survey_repository import SurveyRepository
 from ..repository.answer_repository import AnswerRepository
 from ..repository.question_repository import QuestionRepository
@@ -17,6 +20,42 @@ survey_repo = SurveyRepository()
 answer_repo = AnswerRepository()
 question_repo = QuestionRepository()
 
+# Submissions with at least this many answers are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 50
+
+# Built once at import time and reused for every submission
+_SUBMISSION_ADAPTER = TypeAdapter(SurveyAnswersSubmit)
+
+
+def _inline_schema(model) -> dict:
+    """JSON schema of a model with its $defs inlined, for use in openapi_extra"""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].split("/")[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+
+async def parse_submission(request: Request) -> SurveyAnswersSubmit:
+    """
+    Validate the raw request bytes with the precompiled adapter.
+    Skips the intermediate dict FastAPI would build from the JSON body.
+    """
+    try:
+        return _SUBMISSION_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
 
 @router.get("/", response_model=PaginatedResponse[Survey])
 def get_surveys(page: PositiveInt = 1, limit: int = 100, db: Session = Depends(get_db)):
@@ -99,10 +138,20 @@ def search_surveys(name: str, page: PositiveInt = 1, limit: int = 100, db: Sessi
     )
 
 
-@router.post("/{survey_id}/submit", response_model=List[Answer], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/{survey_id}/submit",
+    response_model=List[Answer],
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema(SurveyAnswersSubmit)}}
+        }
+    }
+)
 def submit_survey_answers(
     survey_id: UUID,
-    submission: SurveyAnswersSubmit,
+    submission: SurveyAnswersSubmit = Depends(parse_submission),
     db: Session = Depends(get_db)
 ):
     """
@@ -144,20 +193,22 @@ def submit_survey_answers(
             detail=f"Invalid question IDs for this survey: {invalid_questions}"
         )
 
-    created_answers = []
-
-    # Create all answers (we already validated they don't exist)
-    for answer_item in submission.answers:
-        answer_create = AnswerCreate(
-            worker_id=submission.worker_id,
-            course_id=submission.course_id,
-            question_id=answer_item.question_id,
-            value=answer_item.value
-        )
-        new_answer = answer_repo.create(db, obj_in=answer_create)
-        created_answers.append(new_answer)
+    # Ids are generated here so the rows can be returned without reading them back
+    rows = [
+        {
+            "id": uuid4(),
+            "worker_id": submission.worker_id,
+            "course_id": submission.course_id,
+            "question_id": answer_item.question_id,
+            "value": answer_item.value
+        }
+        for answer_item in submission.answers
+    ]
 
-    return created_answers
+    # All answers are written in one transaction (we already validated they don't exist)
+    if len(rows) >= COPY_THRESHOLD:
+        return answer_repo.copy_create(db, rows)
+    return answer_repo.bulk_create(db, rows)
 
 
 @router.get("/{survey_id}/worker/{worker_id}/course/{course_id}/answers", response_model=List[Answer])
@@ -165,11 +216,12 @@ def get_worker_survey_answers(
     survey_id: UUID,
     worker_id: UUID,
     course_id: UUID,
+    current_worker: CachedWorker = Depends(get_current_worker),
     db: Session = Depends(get_db)
 ):
     """
     Get all answers from a specific worker for a specific survey and course.
-    Returns all responses without pagination.
+    Returns all responses without pagination; only answers the caller may see are included.
     """
     # Verify survey exists
     survey = survey_repo.get(db, id=survey_id)
@@ -183,7 +235,8 @@ def get_worker_survey_answers(
         db,
         worker_id=worker_id,
         survey_id=survey_id,
-        course_id=course_id
+        course_id=course_id,
+        worker=current_worker
     )
 
     return answers
@@ -3,6 +3,7 @@ from typing import Optional, List
 from uuid import UUID
 from datetime import date
 
+from .bulk import BulkError
 from .worker import Worker
 
 
@@ -38,7 +39,7 @@ class BulkAttendanceCreate(BaseModel):
 class BulkAttendanceResponse(BaseModel):
     created: int
     skipped: int
-    errors: List[str] = []
+    errors: List[BulkError] = []
 
 class AttendanceList(BaseModel):
     items: List[Worker]
\ No newline at end of file
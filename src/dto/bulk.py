@@ -0,0 +1,31 @@
+from enum import IntEnum
+from pydantic import BaseModel, computed_field
+from uuid import UUID
+
+
+class BulkErrorCode(IntEnum):
+    ATTENDANCE_EXISTS = 1
+    WORKER_NOT_FOUND = 2
+    NOT_ENROLLED = 3
+    GRADE_OUT_OF_RANGE = 4
+    DUPLICATE_WORKER = 5
+
+
+BULK_ERROR_MESSAGES = {
+    BulkErrorCode.ATTENDANCE_EXISTS: "Attendance already exists",
+    BulkErrorCode.WORKER_NOT_FOUND: "Worker not found",
+    BulkErrorCode.NOT_ENROLLED: "Worker is not enrolled in this course",
+    BulkErrorCode.GRADE_OUT_OF_RANGE: "Grade must be between 0 and 100",
+    BulkErrorCode.DUPLICATE_WORKER: "Worker appears more than once in the request",
+}
+
+
+class BulkError(BaseModel):
+    """Row-level error of a bulk operation; the message is resolved only when serialized"""
+    code: BulkErrorCode
+    worker_id: UUID
+
+    @computed_field
+    @property
+    def message(self) -> str:
+        return BULK_ERROR_MESSAGES[self.code]
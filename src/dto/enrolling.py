@@ -3,6 +3,7 @@ from typing import Optional, List
 from uuid import UUID
 from decimal import Decimal
 from .course import Course
+from .bulk import BulkError
 from .worker import Worker
 
 
@@ -44,4 +45,4 @@ class BulkGradeUpdate(BaseModel):
 class BulkGradeResponse(BaseModel):
     updated: int
     skipped: int
-    errors: List[str] = []
+    errors: List[BulkError] = []
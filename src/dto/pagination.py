@@ -1,12 +1,13 @@
-from typing import List, TypeVar, Generic
+from typing import List, Optional, TypeVar, Generic
 from pydantic import BaseModel
 
 T = TypeVar('T')
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
-    total_pages: int
+    total_pages: Optional[int]  # None on keyset (`after`) pages; the first page carries the totals
     page: int
-    total_count: int
+    total_count: Optional[int]
+    next_cursor: Optional[str] = None  # Pass as `after` to fetch the next page by keyset, where supported
 
     model_config = {"from_attributes": True}
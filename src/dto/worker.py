@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional
 from uuid import UUID
 
@@ -19,6 +19,14 @@ class WorkerBase(BaseModel):
 class WorkerCreate(WorkerBase):
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def lowercase_email(cls, v: str) -> str:
+        return v.lower()
+
+    class Config:
+        str_strip_whitespace = True  # Sanitize all string fields while parsing
+
 
 class WorkerUpdate(BaseModel):
     department_id: Optional[UUID] = None
@@ -33,6 +41,14 @@ class WorkerUpdate(BaseModel):
     mother_surname: Optional[str] = None
     position: Optional[int] = None
 
+    @field_validator("email")
+    @classmethod
+    def lowercase_email(cls, v: Optional[str]) -> Optional[str]:
+        return v.lower() if v else v
+
+    class Config:
+        str_strip_whitespace = True  # Sanitize all string fields while parsing
+
 
 class Worker(WorkerBase):
     id: UUID
@@ -41,5 +57,18 @@ class Worker(WorkerBase):
         from_attributes = True
 
 
+class WorkerSummary(BaseModel):
+    """Lean worker representation for list endpoints"""
+    id: UUID
+    name: str
+    father_surname: str
+    mother_surname: Optional[str] = None
+    email: str
+    position: int
+
+    class Config:
+        from_attributes = True
+
+
 class WorkerResponse(Worker):
     password: str  # Include password in response for admin purposes
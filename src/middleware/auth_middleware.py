@@ -1,35 +1,67 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, Tuple
+from uuid import UUID
 from src.database import get_db
-from src.utils.auth import decode_access_token
+from src.utils.auth import AUTH_CACHE_TTL_SECONDS, CachedWorker, decode_access_token_cached, worker_cache
 from src.repository.worker_repository import WorkerRepository
+from src.model.enums import WorkerRole
 from src.model.worker import Worker
 
 # Configuración del esquema de seguridad Bearer
 security = HTTPBearer()
+worker_repo = WorkerRepository()
 
 
-async def get_current_worker(
+@dataclass
+class SecurityContext:
+    """
+    Estado de seguridad de una petición, guardado en request.state.security
+
+    - worker: identidad ya resuelta por get_current_worker
+    - rbac_decisions: decisiones de require_role por (worker_id, roles permitidos)
+    """
+    worker: Optional[CachedWorker] = None
+    rbac_decisions: Dict[Tuple[UUID, FrozenSet], bool] = field(default_factory=dict)
+
+
+def get_security_context(request: Request) -> SecurityContext:
+    context: Optional[SecurityContext] = getattr(request.state, "security", None)
+    if context is None:
+        context = SecurityContext()
+        request.state.security = context
+    return context
+
+
+def get_current_worker(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> Worker:
+) -> CachedWorker:
     """
     Dependency para obtener el worker autenticado actual
 
     Extrae el token JWT del header Authorization,
-    lo valida y retorna el worker autenticado
+    lo valida y retorna la identidad del worker autenticado
 
     Lanza HTTPException 401 si:
     - El token no es válido
     - El token ha expirado
     - El worker no existe en la base de datos
+
+    La identidad se guarda en el SecurityContext de la petición y en una caché con TTL
+    (AUTH_CACHE_TTL_SECONDS), así que la mayoría de las peticiones no consultan la BD.
+    Usar get_current_worker_record cuando se necesite el registro completo
+
+    Es síncrona a propósito: FastAPI la ejecuta en el threadpool, así la consulta
+    a la BD no bloquea el event loop
     """
     token = credentials.credentials
 
     # Decodificar el token
-    payload = decode_access_token(token)
+    payload = decode_access_token_cached(token)
 
     if payload is None:
         raise HTTPException(
@@ -39,18 +71,61 @@ async def get_current_worker(
         )
 
     # Obtener el worker_id del payload
-    worker_id: str = payload.get("sub")
+    sub: Optional[str] = payload.get("sub")
 
-    if worker_id is None:
+    if sub is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido - no contiene ID de usuario",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Buscar el worker en la base de datos
-    worker_repo = WorkerRepository()
-    worker = worker_repo.get_by_id(db, worker_id)
+    # Convertir el ID una sola vez; un sub mal formado es un token inválido, no un error de BD
+    try:
+        worker_id = UUID(sub)
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token inválido - ID de usuario mal formado",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Reutilizar el worker ya resuelto en esta petición
+    context = get_security_context(request)
+    if context.worker is not None and context.worker.id == worker_id:
+        return context.worker
+
+    identity: Optional[CachedWorker] = worker_cache.get(worker_id) if AUTH_CACHE_TTL_SECONDS > 0 else None
+
+    if identity is None:
+        # Buscar el worker en la base de datos
+        worker = worker_repo.get_by_id(db, worker_id)
+
+        if worker is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Usuario no encontrado",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        identity = CachedWorker(id=worker.id, position=worker.position, department_id=worker.department_id)
+        if AUTH_CACHE_TTL_SECONDS > 0:
+            worker_cache.set(worker_id, identity)
+
+    context.worker = identity
+    return identity
+
+
+def get_current_worker_record(
+    identity: CachedWorker = Depends(get_current_worker),
+    db: Session = Depends(get_db)
+) -> Worker:
+    """
+    Dependency que carga el registro completo del worker autenticado
+
+    Lanza HTTPException 401 si el worker ya no existe en la base de datos
+    """
+    worker = worker_repo.get_by_id(db, identity.id)
 
     if worker is None:
         raise HTTPException(
@@ -62,10 +137,11 @@ async def get_current_worker(
     return worker
 
 
-async def get_current_worker_optional(
+def get_current_worker_optional(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: Session = Depends(get_db)
-) -> Optional[Worker]:
+) -> Optional[CachedWorker]:
     """
     Dependency para obtener el worker autenticado actual (opcional)
 
@@ -76,27 +152,38 @@ async def get_current_worker_optional(
         return None
 
     try:
-        return await get_current_worker(credentials, db)
+        return get_current_worker(request, credentials, db)
     except HTTPException:
         return None
 
 
-def require_role(*allowed_roles: str):
+def require_role(*allowed_roles: WorkerRole):
     """
     Decorator factory para requerir roles específicos
 
+    Los roles permitidos y el mensaje de error se calculan una sola vez al declarar la dependencia;
+    la decisión se guarda en el SecurityContext para no repetirla en la misma petición
+
     Uso:
-        @router.get("/admin-only")
-        async def admin_endpoint(worker: Worker = Depends(require_role("admin"))):
+        @router.get("/jefes")
+        async def dept_head_endpoint(worker: CachedWorker = Depends(require_role(WorkerRole.DEPT_HEAD))):
             ...
     """
+    allowed = frozenset(int(role) for role in allowed_roles)
+    denied_detail = f"Acceso denegado. Roles permitidos: {', '.join(role.name for role in allowed_roles)}"
+
     async def role_checker(
-        worker: Worker = Depends(get_current_worker)
-    ) -> Worker:
-        if worker.role not in allowed_roles:
+        request: Request,
+        worker: CachedWorker = Depends(get_current_worker)
+    ) -> CachedWorker:
+        decisions = get_security_context(request).rbac_decisions
+        key = (worker.id, allowed)
+        if key not in decisions:
+            decisions[key] = worker.position in allowed
+        if not decisions[key]:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Acceso denegado. Roles permitidos: {', '.join(allowed_roles)}"
+                detail=denied_detail
             )
         return worker
 
@@ -0,0 +1,165 @@
+"""
+Response cache middleware
+Caches successful GET responses in process memory using per-path TTL policies
+"""
+import re
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.cache import TTLCache
+from src.utils.etag import etag_matches
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+@dataclass
+class CachedResponse:
+    fresh_until: float
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+
+class ResponseCacheMiddleware:
+    """
+    Pure ASGI middleware that serves repeated GETs from memory.
+
+    - ttl_policies: (regex, seconds) pairs matched against the path, first match wins;
+      paths matching no policy are never cached
+    - Entries are keyed by path, sorted query string and Authorization header
+    - Expired entries are kept stale_ttl more seconds and served if the handler
+      fails or returns 5xx (e.g. while the database is unreachable)
+    - Any successful unsafe request (POST, PUT, PATCH, DELETE) clears the cache, except on paths
+      matching invalidation_exempt (writes that change no cached data, e.g. login)
+    - The cache lives in process memory: with several worker processes, a write only clears the
+      cache of the process that served it
+    - Cached responses carrying an ETag answer a matching If-None-Match with 304
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        ttl_policies: Iterable[Tuple[str, float]],
+        stale_ttl: float = 300.0,
+        maxsize: int = 1024,
+        invalidation_exempt: Iterable[str] = ()
+    ):
+        self.app = app
+        self.ttl_policies = [(re.compile(pattern), ttl) for pattern, ttl in ttl_policies]
+        self.invalidation_exempt = [re.compile(pattern) for pattern in invalidation_exempt]
+        self.stale_ttl = stale_ttl
+        self.cache = TTLCache(maxsize=maxsize)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] not in SAFE_METHODS:
+            await self._call_and_invalidate(scope, receive, send)
+            return
+
+        ttl = self._ttl_for(scope["path"]) if scope["method"] == "GET" else None
+        if ttl is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = self._cache_key(scope)
+        cached: Optional[CachedResponse] = self.cache.get(key)
+        if cached is not None and cached.fresh_until > time.monotonic():
+            if self._not_modified(scope, cached):
+                await self._replay_not_modified(cached, send)
+            else:
+                await self._replay(cached, send, "HIT")
+            return
+
+        messages: List[Message] = []
+
+        async def capture(message: Message) -> None:
+            messages.append(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        except Exception:
+            if cached is None:
+                raise
+            await self._replay(cached, send, "STALE")
+            return
+
+        status = messages[0]["status"]
+        if status >= 500 and cached is not None:
+            await self._replay(cached, send, "STALE")
+            return
+
+        if status == 200:
+            body = b"".join(message.get("body", b"") for message in messages[1:])
+            self.cache.set(
+                key,
+                CachedResponse(
+                    fresh_until=time.monotonic() + ttl,
+                    status=status,
+                    headers=list(messages[0]["headers"]),
+                    body=body
+                ),
+                ttl=ttl + self.stale_ttl
+            )
+
+        messages[0]["headers"] = list(messages[0]["headers"]) + [(b"x-cache", b"MISS")]
+        for message in messages:
+            await send(message)
+
+    def _ttl_for(self, path: str) -> Optional[float]:
+        for pattern, ttl in self.ttl_policies:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    @staticmethod
+    def _cache_key(scope: Scope) -> Tuple[str, str, bytes]:
+        query = sorted(parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True))
+        authorization = next((value for name, value in scope["headers"] if name == b"authorization"), b"")
+        return scope["path"], "&".join(f"{name}={value}" for name, value in query), authorization
+
+    @staticmethod
+    async def _replay(cached: CachedResponse, send: Send, cache_status: str) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": cached.status,
+            "headers": cached.headers + [(b"x-cache", cache_status.encode())]
+        })
+        await send({"type": "http.response.body", "body": cached.body})
+
+    @staticmethod
+    def _not_modified(scope: Scope, cached: CachedResponse) -> bool:
+        etag = next((value for name, value in cached.headers if name == b"etag"), None)
+        if_none_match = next((value for name, value in scope["headers"] if name == b"if-none-match"), None)
+        if etag is None or if_none_match is None:
+            return False
+        return etag_matches(if_none_match.decode("latin-1"), etag.decode("latin-1"))
+
+    @staticmethod
+    async def _replay_not_modified(cached: CachedResponse, send: Send) -> None:
+        etag = next(value for name, value in cached.headers if name == b"etag")
+        await send({
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [(b"etag", etag), (b"x-cache", b"HIT")]
+        })
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _call_and_invalidate(self, scope: Scope, receive: Receive, send: Send) -> None:
+        status = 500
+
+        async def watch(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, watch)
+        if status < 400 and not any(pattern.search(scope["path"]) for pattern in self.invalidation_exempt):
+            self.cache.clear()
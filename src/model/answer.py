@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Text, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -10,16 +10,22 @@ class Answer(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     worker_id = Column(UUID(as_uuid=True), ForeignKey("workers.id"), nullable=False)
-    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id"), nullable=False)
-    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), nullable=False)
+    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
+    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id", ondelete="CASCADE"), nullable=False)
     value = Column(Text, nullable=False)
 
     # Relationships
-    worker = relationship("Worker", back_populates="answers")
-    course = relationship("Course", back_populates="answers")
-    question = relationship("Question", back_populates="answers")
+    worker = relationship("Worker", back_populates="answers", lazy="raise_on_sql")
+    course = relationship("Course", back_populates="answers", lazy="raise_on_sql")
+    question = relationship("Question", back_populates="answers", lazy="raise_on_sql")
 
     # Constraints
     __table_args__ = (
         UniqueConstraint('worker_id', 'course_id', 'question_id', name='unique_worker_course_question'),
+        # Per-worker and per-course listings paginate in id order
+        Index('answers_worker_id_id_idx', 'worker_id', 'id'),
+        Index('answers_course_id_id_idx', 'course_id', 'id'),
+        Index('answers_question_id_idx', 'question_id'),
+        # Trigram index for substring and similarity search on the answer text
+        Index('answers_value_trgm_idx', 'value', postgresql_using='gin', postgresql_ops={'value': 'gin_trgm_ops'}),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Date, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -10,14 +10,21 @@ class Attendance(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     worker_id = Column(UUID(as_uuid=True), ForeignKey("workers.id"), nullable=False)
-    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id"), nullable=False)
+    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
     attendance_date = Column(Date, nullable=False)
 
     # Relationships
-    worker = relationship("Worker", back_populates="attendances")
-    course = relationship("Course", back_populates="attendances")
+    worker = relationship("Worker", back_populates="attendances", lazy="raise_on_sql")
+    course = relationship("Course", back_populates="attendances", lazy="raise_on_sql")
 
     # Constraints
     __table_args__ = (
         UniqueConstraint('worker_id', 'course_id', 'attendance_date', name='unique_worker_course_date'),
+        # Per-worker and per-course listings paginate in id order
+        Index('attendances_worker_id_id_idx', 'worker_id', 'id'),
+        Index('attendances_course_id_id_idx', 'course_id', 'id'),
+        # Course/date and worker/date lookups, and date ranges
+        Index('attendances_course_id_attendance_date_idx', 'course_id', 'attendance_date'),
+        Index('attendances_worker_id_attendance_date_idx', 'worker_id', 'attendance_date'),
+        Index('attendances_attendance_date_idx', 'attendance_date'),
     )
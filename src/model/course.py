@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Date, Time, Text, SmallInteger, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Date, Time, Text, SmallInteger, ForeignKey, Index, func, literal_column
+from sqlalchemy.dialects.postgresql import DATERANGE, Range, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from ..database import Base
 import uuid
@@ -9,7 +10,7 @@ class Course(Base):
     __tablename__ = "courses"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    period_id = Column(UUID(as_uuid=True), ForeignKey("periods.id"), nullable=False)
+    period_id = Column(UUID(as_uuid=True), ForeignKey("periods.id", ondelete="CASCADE"), nullable=False)
     target = Column(String(255), nullable=False)
     name = Column(String(150), nullable=False)
     start_date = Column(Date, nullable=False)
@@ -23,8 +24,37 @@ class Course(Base):
     details = Column(Text)
 
     # Relationships
-    period = relationship("Period", back_populates="courses")
-    instructors = relationship("Instructor", back_populates="course")
-    enrollments = relationship("Enrolling", back_populates="course")
-    attendances = relationship("Attendance", back_populates="course")
-    answers = relationship("Answer", back_populates="course")
+    period = relationship("Period", back_populates="courses", lazy="raise_on_sql")
+    # Child rows are removed by their ON DELETE CASCADE foreign keys
+    instructors = relationship("Instructor", back_populates="course", lazy="raise_on_sql", passive_deletes=True)
+    enrollments = relationship("Enrolling", back_populates="course", passive_deletes=True)
+    attendances = relationship("Attendance", back_populates="course", passive_deletes=True)
+    answers = relationship("Answer", back_populates="course", passive_deletes=True)
+
+    @hybrid_property
+    def date_range(self) -> Range:
+        """Inclusive range of the days the course runs"""
+        return Range(self.start_date, self.end_date, bounds="[]")
+
+    @date_range.inplace.expression
+    @classmethod
+    def _date_range_expression(cls):
+        # Must match the expression of courses_date_range_idx for the index to be used
+        return func.daterange(cls.start_date, cls.end_date, literal_column("'[]'"), type_=DATERANGE)
+
+    # Indexes
+    __table_args__ = (
+        # Filtered list endpoints paginate in id order
+        Index("courses_period_id_id_idx", period_id, id),
+        Index("courses_course_type_id_idx", course_type, id),
+        Index("courses_modality_id_idx", modality, id),
+        Index("courses_course_profile_id_idx", course_profile, id),
+        # Trigram index for ILIKE '%...%' name search
+        Index("courses_name_trgm_idx", name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        # Active-course and date-overlap lookups (@> and && on the course's date range)
+        Index(
+            "courses_date_range_idx",
+            func.daterange(start_date, end_date, literal_column("'[]'")),
+            postgresql_using="gist"
+        ),
+    )
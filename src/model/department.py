@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -13,3 +13,9 @@ class Department(Base):
 
     # Relationships
     workers = relationship("Worker", back_populates="department")
+
+    # Indexes
+    __table_args__ = (
+        # Trigram index for ILIKE '%...%' name search
+        Index("departments_name_trgm_idx", name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
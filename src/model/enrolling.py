@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, UniqueConstraint, Numeric
+from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -10,14 +10,19 @@ class Enrolling(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     worker_id = Column(UUID(as_uuid=True), ForeignKey("workers.id"), nullable=False)
-    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id"), nullable=False)
+    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
     final_grade = Column(Numeric(5, 2))
 
     # Relationships
-    worker = relationship("Worker", back_populates="enrollments")
-    course = relationship("Course", back_populates="enrollments")
+    worker = relationship("Worker", back_populates="enrollments", lazy="raise_on_sql")
+    course = relationship("Course", back_populates="enrollments", lazy="raise_on_sql")
 
     # Constraints
     __table_args__ = (
         UniqueConstraint('worker_id', 'course_id', name='unique_worker_course_enrollment'),
+        # Per-worker and per-course listings paginate in id order
+        Index('enrollings_worker_id_id_idx', 'worker_id', 'id'),
+        Index('enrollings_course_id_id_idx', 'course_id', 'id'),
+        # Grade range filter; ungraded enrollments never match a range, so they are left out of the index
+        Index('enrollings_final_grade_idx', 'final_grade', postgresql_where=final_grade.isnot(None)),
     )
@@ -0,0 +1,7 @@
+from enum import IntEnum
+
+
+class WorkerRole(IntEnum):
+    """Codes stored in Worker.position"""
+    TEACHER = 0  # docente
+    DEPT_HEAD = 1  # jefe de departamento
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -10,13 +10,16 @@ class Instructor(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     worker_id = Column(UUID(as_uuid=True), ForeignKey("workers.id"), nullable=False)
-    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id"), nullable=False)
+    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
 
     # Relationships
-    worker = relationship("Worker", back_populates="instructor_courses")
-    course = relationship("Course", back_populates="instructors")
+    worker = relationship("Worker", back_populates="instructor_courses", lazy="raise_on_sql")
+    course = relationship("Course", back_populates="instructors", lazy="raise_on_sql")
 
     # Constraints
     __table_args__ = (
         UniqueConstraint('worker_id', 'course_id', name='unique_worker_course'),
+        # Per-worker and per-course listings paginate in id order
+        Index('instructors_worker_id_id_idx', 'worker_id', 'id'),
+        Index('instructors_course_id_id_idx', 'course_id', 'id'),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date
+from sqlalchemy import Column, String, Date, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -14,4 +14,12 @@ class Period(Base):
     end_date = Column(Date, nullable=False)
 
     # Relationships
-    courses = relationship("Course", back_populates="period")
+    # Courses are removed by the ON DELETE CASCADE foreign key, not loaded by the ORM
+    courses = relationship("Course", back_populates="period", passive_deletes=True)
+
+    # Indexes
+    __table_args__ = (
+        # Exact name lookups (duplicate checks) and date-range / active-period filters
+        Index("periods_name_idx", name),
+        Index("periods_start_date_end_date_idx", start_date, end_date),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, SmallInteger, ForeignKey
+from sqlalchemy import Column, String, SmallInteger, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -9,10 +9,17 @@ class Question(Base):
     __tablename__ = "questions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    survey_id = Column(UUID(as_uuid=True), ForeignKey("surveys.id"), nullable=False)
+    survey_id = Column(UUID(as_uuid=True), ForeignKey("surveys.id", ondelete="CASCADE"), nullable=False)
     question = Column(String(100), nullable=False)
     question_order = Column(SmallInteger, nullable=False)
 
     # Relationships
     survey = relationship("Survey", back_populates="questions")
-    answers = relationship("Answer", back_populates="question")
+    answers = relationship("Answer", back_populates="question", passive_deletes=True)
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('survey_id', 'question_order', name='unique_survey_question_order'),
+        # Trigram index for ILIKE '%...%' question text search
+        Index('questions_question_trgm_idx', 'question', postgresql_using='gin', postgresql_ops={'question': 'gin_trgm_ops'}),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date
+from sqlalchemy import Column, String, Date, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -13,4 +13,11 @@ class Survey(Base):
     created_at = Column(Date, nullable=False, default="CURRENT_DATE")
 
     # Relationships
-    questions = relationship("Question", back_populates="survey")
+    # Questions (and their answers) are removed by the ON DELETE CASCADE foreign keys
+    questions = relationship("Question", back_populates="survey", passive_deletes=True)
+
+    # Indexes
+    __table_args__ = (
+        # Trigram index for ILIKE '%...%' name search
+        Index("surveys_name_trgm_idx", name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
@@ -1,7 +1,10 @@
-from sqlalchemy import Column, String, SmallInteger, ForeignKey
+from sqlalchemy import Column, String, SmallInteger, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
+from typing import Optional
 from ..database import Base
+from .enums import WorkerRole
 import uuid
 
 
@@ -19,11 +22,48 @@ class Worker(Base):
     name = Column(String(45), nullable=False)
     father_surname = Column(String(40), nullable=False)
     mother_surname = Column(String(40))
-    position = Column(SmallInteger, nullable=False)  # 0 = docente, 1 = jefe de departamento
+    position = Column(SmallInteger, nullable=False)  # WorkerRole: 0 = docente, 1 = jefe de departamento
 
     # Relationships
-    department = relationship("Department", back_populates="workers")
+    department = relationship("Department", back_populates="workers", lazy="raise_on_sql")
     instructor_courses = relationship("Instructor", back_populates="worker")
     enrollments = relationship("Enrolling", back_populates="worker")
     attendances = relationship("Attendance", back_populates="worker")
     answers = relationship("Answer", back_populates="worker")
+
+    @hybrid_property
+    def role(self) -> Optional[WorkerRole]:
+        """Position as a WorkerRole, or None for an unknown code"""
+        return WorkerRole(self.position) if self.position in WorkerRole._value2member_map_ else None
+
+    @role.inplace.expression
+    @classmethod
+    def _role_expression(cls):
+        return cls.position
+
+    @hybrid_property
+    def full_name(self) -> str:
+        """Name followed by both surnames, space separated"""
+        return f"{self.name} {self.father_surname} {self.mother_surname or ''}"
+
+    @full_name.inplace.expression
+    @classmethod
+    def _full_name_expression(cls):
+        # Must match the expression of workers_full_name_trgm_idx for the index to be used
+        return cls.name + " " + cls.father_surname + " " + func.coalesce(cls.mother_surname, "")
+
+    # Indexes
+    __table_args__ = (
+        # Case-insensitive email lookups and uniqueness
+        Index("workers_email_lower_idx", func.lower(email), unique=True),
+        # Filtered list endpoints paginate in id order
+        Index("workers_department_id_id_idx", department_id, id),
+        Index("workers_position_id_idx", position, id),
+        # Trigram index for ILIKE '%...%' search over name and surnames in a single probe
+        Index(
+            "workers_full_name_trgm_idx",
+            (name + " " + father_surname + " " + func.coalesce(mother_surname, "")).label("full_name"),
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"}
+        ),
+    )
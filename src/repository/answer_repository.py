@@ -1,9 +1,14 @@
 from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, contains_eager
 from uuid import UUID
-import math
+import csv
+import io
 from ..model.answer import Answer
+from ..model.question import Question
 from ..dto.answer import AnswerCreate, AnswerUpdate
+from ..utils.auth import CachedWorker
 from .base import BaseRepository
 
 
@@ -11,93 +16,156 @@ class AnswerRepository(BaseRepository[Answer, AnswerCreate, AnswerUpdate]):
     def __init__(self):
         super().__init__(Answer)
 
+    def create_if_absent(self, db: Session, obj_in: AnswerCreate) -> Optional[Answer]:
+        """
+        Insert an answer unless the worker already answered the question in the course.
+        Returns None on conflict; the unique constraint makes the check race-free.
+        """
+        stmt = pg_insert(Answer).values(**obj_in.model_dump()).on_conflict_do_nothing(
+            index_elements=['worker_id', 'course_id', 'question_id']
+        ).returning(Answer)
+        answer = db.execute(stmt).scalar_one_or_none()
+        db.commit()
+        return answer
+
+    def bulk_create(self, db: Session, rows: List[dict]) -> List[dict]:
+        """
+        Insert many answers with a single executemany round-trip.
+        Rows must already carry their id so they can be returned without a refresh.
+        """
+        db.execute(insert(Answer), rows)
+        db.commit()
+        return rows
+
+    def copy_create(self, db: Session, rows: List[dict]) -> List[dict]:
+        """
+        Stream many answers through COPY ... FROM STDIN, skipping INSERT parsing.
+        Rows must already carry their id so they can be returned without a refresh.
+        """
+        buffer = io.StringIO()
+        # Quote everything so empty answers are loaded as '' instead of NULL
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        for row in rows:
+            writer.writerow((row["id"], row["worker_id"], row["course_id"], row["question_id"], row["value"]))
+        buffer.seek(0)
+
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                "COPY answers (id, worker_id, course_id, question_id, value) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
+        db.commit()
+        return rows
+
     def get_by_worker(self, db: Session, worker_id: UUID) -> List[Answer]:
-        return db.query(Answer).filter(Answer.worker_id == worker_id).all()
+        stmt = lambda_stmt(lambda: select(Answer).where(Answer.worker_id == worker_id))
+        return db.execute(stmt).scalars().all()
 
     def get_by_course(self, db: Session, course_id: UUID) -> List[Answer]:
-        return db.query(Answer).filter(Answer.course_id == course_id).all()
+        stmt = lambda_stmt(lambda: select(Answer).where(Answer.course_id == course_id))
+        return db.execute(stmt).scalars().all()
 
     def get_by_question(self, db: Session, question_id: UUID) -> List[Answer]:
-        return db.query(Answer).filter(Answer.question_id == question_id).all()
+        stmt = lambda_stmt(lambda: select(Answer).where(Answer.question_id == question_id))
+        return db.execute(stmt).scalars().all()
 
     def get_by_worker_and_course(self, db: Session, worker_id: UUID, course_id: UUID) -> List[Answer]:
-        return db.query(Answer).filter(
+        stmt = lambda_stmt(lambda: select(Answer).where(
             Answer.worker_id == worker_id,
             Answer.course_id == course_id
-        ).all()
+        ))
+        return db.execute(stmt).scalars().all()
 
     def get_by_worker_course_and_question(self, db: Session, worker_id: UUID, course_id: UUID, question_id: UUID) -> Optional[Answer]:
-        return db.query(Answer).filter(
+        stmt = lambda_stmt(lambda: select(Answer).where(
             Answer.worker_id == worker_id,
             Answer.course_id == course_id,
             Answer.question_id == question_id
-        ).first()
+        ))
+        return db.execute(stmt).scalars().first()
 
-    def get_by_survey(self, db: Session, survey_id: UUID) -> List[Answer]:
-        return db.query(Answer).join(Answer.question).filter(
-            Answer.question.has(survey_id=survey_id)
-        ).all()
-
-    def get_by_worker_survey_and_course(self, db: Session, worker_id: UUID, survey_id: UUID, course_id: UUID) -> List[Answer]:
-        """Get answers from a worker for a specific survey and course"""
-        from ..model.question import Question
-        return db.query(Answer).join(Question).filter(
+    def exists_by_worker_course_and_question(self, db: Session, worker_id: UUID, course_id: UUID, question_id: UUID, exclude_id: Optional[UUID] = None) -> bool:
+        """Whether the worker already answered the question in the course, ignoring exclude_id"""
+        query = db.query(Answer.id).filter(
             Answer.worker_id == worker_id,
             Answer.course_id == course_id,
+            Answer.question_id == question_id
+        )
+        if exclude_id is not None:
+            query = query.filter(Answer.id != exclude_id)
+        return db.query(query.exists()).scalar()
+
+    def get_by_survey(self, db: Session, survey_id: UUID) -> List[Answer]:
+        # Filter on the joined question and populate Answer.question from the same row
+        return db.query(Answer).join(Answer.question).options(contains_eager(Answer.question)).filter(
             Question.survey_id == survey_id
         ).all()
 
-    def search_by_value(self, db: Session, value: str) -> List[Answer]:
-        return db.query(Answer).filter(Answer.value.ilike(f"%{value}%")).all()
-
-    def get_by_worker_paginated(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Answer], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Answer).filter(Answer.worker_id == worker_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Answer).filter(Answer.worker_id == worker_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def get_by_course_paginated(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Answer], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Answer).filter(Answer.course_id == course_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Answer).filter(Answer.course_id == course_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def get_by_question_paginated(self, db: Session, question_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Answer], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Answer).filter(Answer.question_id == question_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Answer).filter(Answer.question_id == question_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def get_by_worker_and_course_paginated(self, db: Session, worker_id: UUID, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Answer], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Answer).filter(
+    def get_by_worker_survey_and_course(self, db: Session, worker_id: UUID, survey_id: UUID, course_id: UUID, worker: Optional[CachedWorker] = None) -> List[Answer]:
+        """
+        Get answers from a worker for a specific survey and course.
+        Passing a worker restricts the rows through _apply_rbac.
+        """
+        if worker is not None:
+            return self._apply_rbac(db.query(Answer).join(Question).filter(
+                Answer.worker_id == worker_id,
+                Answer.course_id == course_id,
+                Question.survey_id == survey_id
+            ), worker).all()
+        stmt = lambda_stmt(lambda: select(Answer).join(Question).where(
             Answer.worker_id == worker_id,
-            Answer.course_id == course_id
-        ).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Answer).filter(
+            Answer.course_id == course_id,
+            Question.survey_id == survey_id
+        ))
+        return db.execute(stmt).scalars().all()
+
+    @staticmethod
+    def _value_search(query, value: str, min_similarity: Optional[float] = None):
+        """
+        Answers containing the text, or, given min_similarity, answers similar to it
+        (pg_trgm % operator, then similarity >= min_similarity), most similar first.
+        Both forms are served by the answers_value_trgm_idx index.
+        """
+        if min_similarity is None:
+            query = query.filter(Answer.value.ilike(f"%{value}%"))
+        else:
+            query = query.filter(
+                Answer.value.op("%")(value),
+                func.similarity(Answer.value, value) >= min_similarity
+            )
+        return query.order_by(func.similarity(Answer.value, value).desc(), Answer.id)
+
+    def search_by_value(self, db: Session, value: str, min_similarity: Optional[float] = None) -> List[Answer]:
+        return self._value_search(db.query(Answer), value, min_similarity).all()
+
+    def get_by_worker_paginated(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Answer], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Answer).filter(Answer.worker_id == worker_id).order_by(Answer.id), worker), page, limit)
+
+    def get_by_worker_after(self, db: Session, worker_id: UUID, after: Optional[UUID], limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Answer], Optional[int], Optional[int]]:
+        return self._paginate_after(self._apply_rbac(db.query(Answer).filter(Answer.worker_id == worker_id), worker), after, limit)
+
+    def get_by_course_paginated(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Answer], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Answer).filter(Answer.course_id == course_id).order_by(Answer.id), worker), page, limit)
+
+    def get_by_course_after(self, db: Session, course_id: UUID, after: Optional[UUID], limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Answer], Optional[int], Optional[int]]:
+        return self._paginate_after(self._apply_rbac(db.query(Answer).filter(Answer.course_id == course_id), worker), after, limit)
+
+    def get_by_question_paginated(self, db: Session, question_id: UUID, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Answer], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Answer).filter(Answer.question_id == question_id), worker), page, limit)
+
+    def get_by_worker_and_course_paginated(self, db: Session, worker_id: UUID, course_id: UUID, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Answer], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Answer).filter(
             Answer.worker_id == worker_id,
             Answer.course_id == course_id
-        ).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def get_by_survey_paginated(self, db: Session, survey_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Answer], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Answer).join(Answer.question).filter(
-            Answer.question.has(survey_id=survey_id)
-        ).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Answer).join(Answer.question).filter(
-            Answer.question.has(survey_id=survey_id)
-        ).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def search_by_value_paginated(self, db: Session, value: str, page: int = 1, limit: int = 100) -> Tuple[List[Answer], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Answer).filter(Answer.value.ilike(f"%{value}%")).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Answer).filter(Answer.value.ilike(f"%{value}%")).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        ), worker), page, limit)
+
+    def get_by_survey_paginated(self, db: Session, survey_id: UUID, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Answer], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Answer).join(Answer.question).filter(
+            Question.survey_id == survey_id
+        ), worker), page, limit)
+
+    def search_by_value_paginated(self, db: Session, value: str, page: int = 1, limit: int = 100, min_similarity: Optional[float] = None, worker: Optional[CachedWorker] = None) -> Tuple[List[Answer], int, int]:
+        return self._paginate(self._apply_rbac(self._value_search(db.query(Answer), value, min_similarity), worker), page, limit)
@@ -1,11 +1,13 @@
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session, joinedload
 from uuid import UUID
 from datetime import date
-import math
 from ..model.attendance import Attendance
 from ..model.worker import Worker
 from ..dto.attendance import AttendanceCreate, AttendanceUpdate
+from ..utils.auth import CachedWorker
 from .base import BaseRepository
 
 
@@ -13,89 +15,127 @@ class AttendanceRepository(BaseRepository[Attendance, AttendanceCreate, Attendan
     def __init__(self):
         super().__init__(Attendance)
 
+    def create_if_absent(self, db: Session, obj_in: AttendanceCreate) -> Optional[Attendance]:
+        """
+        Record an attendance unless one exists for the same worker, course and date.
+        Returns None on conflict; the unique constraint makes the check race-free.
+        """
+        stmt = insert(Attendance).values(**obj_in.model_dump()).on_conflict_do_nothing(
+            index_elements=['worker_id', 'course_id', 'attendance_date']
+        ).returning(Attendance)
+        attendance = db.execute(stmt).scalar_one_or_none()
+        db.commit()
+        return attendance
+
+    def bulk_create(self, db: Session, course_id: UUID, attendance_date: date, worker_ids: List[UUID]) -> List[UUID]:
+        """
+        Record attendance for many workers in a single INSERT ... ON CONFLICT DO NOTHING.
+        Returns the ids of the workers whose attendance was created; the rest already had one.
+        """
+        if not worker_ids:
+            return []
+        stmt = insert(Attendance).values([
+            {"worker_id": worker_id, "course_id": course_id, "attendance_date": attendance_date}
+            for worker_id in worker_ids
+        ]).on_conflict_do_nothing(
+            index_elements=['worker_id', 'course_id', 'attendance_date']
+        ).returning(Attendance.worker_id)
+        created = db.execute(stmt).scalars().all()
+        db.commit()
+        return created
+
     def get_by_worker(self, db: Session, worker_id: UUID) -> List[Attendance]:
-        return db.query(Attendance).filter(Attendance.worker_id == worker_id).all()
+        stmt = lambda_stmt(lambda: select(Attendance).where(Attendance.worker_id == worker_id))
+        return db.execute(stmt).scalars().all()
 
     def get_by_course(self, db: Session, course_id: UUID) -> List[Attendance]:
-        return db.query(Attendance).filter(Attendance.course_id == course_id).all()
+        stmt = lambda_stmt(lambda: select(Attendance).where(Attendance.course_id == course_id))
+        return db.execute(stmt).scalars().all()
+
+    def iter_dates_by_course(self, db: Session, course_id: UUID, batch_size: int = 500) -> Iterator[Tuple[UUID, date]]:
+        """
+        (worker_id, attendance_date) of every attendance of the course, without building ORM objects.
+        Rows are streamed from a server-side cursor batch_size at a time.
+        """
+        stmt = select(Attendance.worker_id, Attendance.attendance_date).where(
+            Attendance.course_id == course_id
+        ).execution_options(yield_per=batch_size)
+        yield from db.execute(stmt).tuples()
 
     def get_by_worker_and_course(self, db: Session, worker_id: UUID, course_id: UUID) -> List[Attendance]:
-        return db.query(Attendance).filter(
+        stmt = lambda_stmt(lambda: select(Attendance).where(
             Attendance.worker_id == worker_id,
             Attendance.course_id == course_id
-        ).all()
+        ))
+        return db.execute(stmt).scalars().all()
 
     def get_by_date(self, db: Session, attendance_date: date) -> List[Attendance]:
-        return db.query(Attendance).filter(Attendance.attendance_date == attendance_date).all()
+        stmt = lambda_stmt(lambda: select(Attendance).where(Attendance.attendance_date == attendance_date))
+        return db.execute(stmt).scalars().all()
 
     def get_by_worker_and_date(self, db: Session, worker_id: UUID, attendance_date: date) -> List[Attendance]:
-        return db.query(Attendance).filter(
+        stmt = lambda_stmt(lambda: select(Attendance).where(
             Attendance.worker_id == worker_id,
             Attendance.attendance_date == attendance_date
-        ).all()
+        ))
+        return db.execute(stmt).scalars().all()
 
     def get_by_course_and_date(self, db: Session, course_id: UUID, attendance_date: date) -> List[Worker]:
-        return db.query(Worker).join(Attendance, Attendance.worker_id == Worker.id).filter(
+        stmt = lambda_stmt(lambda: select(Worker).join(Attendance, Attendance.worker_id == Worker.id).where(
             Attendance.course_id == course_id,
             Attendance.attendance_date == attendance_date
-        ).all()
+        ))
+        return db.execute(stmt).scalars().all()
 
     def get_by_worker_course_and_date(self, db: Session, worker_id: UUID, course_id: UUID, attendance_date: date) -> Optional[Attendance]:
-        return db.query(Attendance).filter(
+        stmt = lambda_stmt(lambda: select(Attendance).where(
+            Attendance.worker_id == worker_id,
+            Attendance.course_id == course_id,
+            Attendance.attendance_date == attendance_date
+        ))
+        return db.execute(stmt).scalars().first()
+
+    def exists_by_worker_course_and_date(self, db: Session, worker_id: UUID, course_id: UUID, attendance_date: date, exclude_id: Optional[UUID] = None) -> bool:
+        """Whether attendance is already recorded for the worker, course and date, ignoring exclude_id"""
+        query = db.query(Attendance.id).filter(
             Attendance.worker_id == worker_id,
             Attendance.course_id == course_id,
             Attendance.attendance_date == attendance_date
-        ).first()
+        )
+        if exclude_id is not None:
+            query = query.filter(Attendance.id != exclude_id)
+        return db.query(query.exists()).scalar()
 
     def get_date_range(self, db: Session, start_date: date, end_date: date) -> List[Attendance]:
-        return db.query(Attendance).filter(
+        stmt = lambda_stmt(lambda: select(Attendance).where(
             Attendance.attendance_date >= start_date,
             Attendance.attendance_date <= end_date
-        ).all()
-
-    def get_by_worker_paginated(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Attendance], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Attendance).filter(Attendance.worker_id == worker_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Attendance).filter(Attendance.worker_id == worker_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def get_by_course_paginated(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Attendance], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Attendance).filter(Attendance.course_id == course_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Attendance).filter(Attendance.course_id == course_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def get_by_worker_and_course_paginated(self, db: Session, worker_id: UUID, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Attendance], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Attendance).filter(
-            Attendance.worker_id == worker_id,
-            Attendance.course_id == course_id
-        ).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Attendance).filter(
+        ))
+        return db.execute(stmt).scalars().all()
+
+    def get_by_worker_paginated(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Attendance], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Attendance).filter(Attendance.worker_id == worker_id).order_by(Attendance.id), worker), page, limit)
+
+    def get_by_worker_after(self, db: Session, worker_id: UUID, after: Optional[UUID], limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Attendance], Optional[int], Optional[int]]:
+        return self._paginate_after(self._apply_rbac(db.query(Attendance).filter(Attendance.worker_id == worker_id), worker), after, limit)
+
+    def get_by_course_paginated(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Attendance], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Attendance).filter(Attendance.course_id == course_id).order_by(Attendance.id), worker), page, limit)
+
+    def get_by_course_after(self, db: Session, course_id: UUID, after: Optional[UUID], limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Attendance], Optional[int], Optional[int]]:
+        return self._paginate_after(self._apply_rbac(db.query(Attendance).filter(Attendance.course_id == course_id), worker), after, limit)
+
+    def get_by_worker_and_course_paginated(self, db: Session, worker_id: UUID, course_id: UUID, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Attendance], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Attendance).filter(
             Attendance.worker_id == worker_id,
             Attendance.course_id == course_id
-        ).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def get_by_date_paginated(self, db: Session, attendance_date: date, page: int = 1, limit: int = 100) -> Tuple[List[Attendance], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Attendance).filter(Attendance.attendance_date == attendance_date).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Attendance).filter(Attendance.attendance_date == attendance_date).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
-
-    def get_date_range_paginated(self, db: Session, start_date: date, end_date: date, page: int = 1, limit: int = 100) -> Tuple[List[Attendance], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Attendance).filter(
-            Attendance.attendance_date >= start_date,
-            Attendance.attendance_date <= end_date
-        ).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Attendance).filter(
+        ), worker), page, limit)
+
+    def get_by_date_paginated(self, db: Session, attendance_date: date, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Attendance], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Attendance).filter(Attendance.attendance_date == attendance_date), worker), page, limit)
+
+    def get_date_range_paginated(self, db: Session, start_date: date, end_date: date, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[Attendance], int, int]:
+        return self._paginate(self._apply_rbac(db.query(Attendance).filter(
             Attendance.attendance_date >= start_date,
             Attendance.attendance_date <= end_date
-        ).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        ), worker), page, limit)
@@ -1,8 +1,11 @@
-from typing import TypeVar, Generic, Type, Optional, List, Any, Tuple
-from sqlalchemy.orm import Session
+from typing import TypeVar, Generic, Type, Optional, List, Any, Tuple, Dict, Union
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import Query, Session
 from pydantic import BaseModel
 from uuid import UUID
-import math
+from ..model.enums import WorkerRole
+from ..model.worker import Worker
+from ..utils.auth import CachedWorker
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -10,79 +13,187 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    CRUD and pagination shared by the repositories.
+    Hot finders in the subclasses build their statements with lambda_stmt, so their SQL is
+    compiled once and then served from the statement cache.
+    """
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
+        self._columns: Dict[str, Any] = {}
+
+    def _column(self, field: str) -> Any:
+        """
+        Mapped attribute of the model for a field name, resolved once per repository.
+        Raises AttributeError for unknown fields, like getattr.
+        """
+        column = self._columns.get(field)
+        if column is None:
+            column = self._columns[field] = getattr(self.model, field)
+        return column
+
+    def load_options(self) -> Tuple:
+        """Loader options applied to every read, e.g. selectinload() for relationships the DTO serializes"""
+        return ()
+
+    def query(self, db: Session) -> Query:
+        """Base query for reads, with the repository's loader options applied"""
+        return db.query(self.model).options(*self.load_options())
 
     def get(self, db: Session, id: UUID) -> Optional[ModelType]:
-        return db.query(self.model).filter(self.model.id == id).first()
+        """
+        Primary key lookup through the session identity map; an object already loaded
+        in this session is returned without a SELECT.
+        Repositories with loader options query instead, since an identity map hit
+        would skip them.
+        """
+        if self.load_options():
+            return self.query(db).filter(self.model.id == id).first()
+        return db.get(self.model, id)
 
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        return db.query(self.model).offset(skip).limit(limit).all()
+        return self.query(db).offset(skip).limit(limit).all()
 
-    def get_multi_paginated(self, db: Session, page: int = 1, limit: int = 100) -> Tuple[List[ModelType], int, int]:
+    @staticmethod
+    def _contains(column: Any, text: str) -> Any:
         """
-        Get paginated results with total count and total pages.
+        Case-insensitive match of the text anywhere in a column.
+        The searched columns carry pg_trgm GIN indexes (e.g. courses_name_trgm_idx), which serve
+        texts of three or more characters; shorter texts still match anywhere, at the cost of a scan.
+        """
+        return column.ilike(f"%{text}%")
+
+    def _apply_rbac(self, query: Query, worker: Optional[CachedWorker]) -> Query:
+        """
+        Restrict a query on a model with a worker_id column to the rows the worker may see:
+        department heads see their department's workers, other workers only their own rows.
+        Without a worker the query is returned unchanged.
+        """
+        if worker is None:
+            return query
+        if worker.role is WorkerRole.DEPT_HEAD:
+            department_workers = select(Worker.id).where(Worker.department_id == worker.department_id)
+            return query.filter(self.model.worker_id.in_(department_workers))
+        return query.filter(self.model.worker_id == worker.id)
+
+    def get_visible(self, db: Session, id: UUID, worker: CachedWorker) -> Optional[ModelType]:
+        """Primary key lookup restricted through _apply_rbac; None when the row is missing or hidden from the worker"""
+        return self._apply_rbac(self.query(db).filter(self.model.id == id), worker).first()
+
+    def _paginate(self, query: Query, page: int, limit: int) -> Tuple[List[Any], int, int]:
+        """
+        Fetch one page of a query together with its total count in a single statement,
+        reading the total from count(*) OVER () on the returned rows.
+        Only an empty page past the end needs a separate COUNT.
         Returns: (items, total_pages, total_count)
         """
-        # Calculate offset
         offset = (page - 1) * limit
-        
-        # Get total count
-        total_count = db.query(self.model).count()
-        
-        # Calculate total pages
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        
-        # Get paginated results
-        items = db.query(self.model).offset(offset).limit(limit).all()
-        
+        rows = query.add_columns(func.count().over()).offset(offset).limit(limit).all()
+
+        if rows:
+            total_count = rows[0][-1]
+        elif offset > 0:
+            total_count = query.order_by(None).count()
+        else:
+            total_count = 0
+
+        items = [row[0] for row in rows]
+        total_pages = -(-total_count // limit)
         return items, total_pages, total_count
 
+    def _paginate_after(self, query: Query, after: Optional[UUID], limit: int) -> Tuple[List[Any], Optional[int], Optional[int]]:
+        """
+        Keyset pagination on the primary key: the rows whose id follows `after`, in id order.
+        Unlike OFFSET, the skipped rows are never read. No COUNT is run either: the client
+        already got the total with the first page, so both totals are None.
+        A *_paginated finder with an *_after counterpart orders by id as well, so its OFFSET
+        pages and the keyset pages that follow them line up.
+        Returns: (items, None, None)
+        """
+        page_query = query.order_by(self.model.id)
+        if after is not None:
+            page_query = page_query.filter(self.model.id > after)
+        items = page_query.limit(limit).all()
+
+        return items, None, None
+
+    def get_multi_paginated(self, db: Session, page: int = 1, limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[ModelType], int, int]:
+        """
+        Get paginated results with total count and total pages.
+        Passing a worker (models with a worker_id column only) restricts the rows through _apply_rbac.
+        Returns: (items, total_pages, total_count)
+        """
+        return self._paginate(self._apply_rbac(self.query(db).order_by(self.model.id), worker), page, limit)
+
+    def get_multi_after(self, db: Session, after: Optional[UUID], limit: int = 100, worker: Optional[CachedWorker] = None) -> Tuple[List[ModelType], Optional[int], Optional[int]]:
+        """
+        Keyset counterpart of get_multi_paginated: the rows following the id `after`.
+        Returns: (items, None, None)
+        """
+        return self._paginate_after(self._apply_rbac(self.query(db), worker), after, limit)
+
+    def _refresh(self, db: Session, db_obj: ModelType) -> ModelType:
+        """Reload an object after a commit, with the repository's loader options applied"""
+        if not self.load_options():
+            db.refresh(db_obj)
+            return db_obj
+        return self.query(db).populate_existing().filter(self.model.id == inspect(db_obj).identity[0]).one()
+
     def create(self, db: Session, obj_in: CreateSchemaType) -> ModelType:
         obj_data = obj_in.model_dump()
         db_obj = self.model(**obj_data)
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self._refresh(db, db_obj)
 
-    def update(self, db: Session, db_obj: ModelType, obj_in: UpdateSchemaType) -> ModelType:
-        obj_data = obj_in.model_dump(exclude_unset=True)
-        for field, value in obj_data.items():
+    @staticmethod
+    def _changed_fields(db_obj: ModelType, obj_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The fields of obj_data whose value differs from the one already on db_obj.
+        Fields that are not mapped attributes of the model are ignored.
+        """
+        mapped = inspect(db_obj).mapper.attrs
+        return {
+            field: value for field, value in obj_data.items()
+            if field in mapped and getattr(db_obj, field) != value
+        }
+
+    def update(self, db: Session, db_obj: ModelType, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> ModelType:
+        """
+        Apply the set fields of obj_in to db_obj and commit.
+        Only changed fields are assigned; when nothing changes no UPDATE or commit is issued.
+        """
+        obj_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        changes = self._changed_fields(db_obj, obj_data)
+        if not changes:
+            return db_obj
+        for field, value in changes.items():
             setattr(db_obj, field, value)
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self._refresh(db, db_obj)
 
     def delete(self, db: Session, id: UUID) -> Optional[ModelType]:
-        obj = db.query(self.model).filter(self.model.id == id).first()
+        obj = db.get(self.model, id)
         if obj:
             db.delete(obj)
             db.commit()
         return obj
 
+    def _select_by_field(self, field: str, value: Any):
+        """2.0-style select() of the rows whose field equals value, with the repository's loader options"""
+        return select(self.model).options(*self.load_options()).where(self._column(field) == value)
+
     def get_by_field(self, db: Session, field: str, value: Any) -> Optional[ModelType]:
-        return db.query(self.model).filter(getattr(self.model, field) == value).first()
+        return db.execute(self._select_by_field(field, value).limit(1)).scalars().first()
 
     def get_multi_by_field(self, db: Session, field: str, value: Any) -> List[ModelType]:
-        return db.query(self.model).filter(getattr(self.model, field) == value).all()
+        return db.execute(self._select_by_field(field, value)).scalars().all()
 
     def get_multi_by_field_paginated(self, db: Session, field: str, value: Any, page: int = 1, limit: int = 100) -> Tuple[List[ModelType], int, int]:
         """
         Get paginated results filtered by field with total count and total pages.
         Returns: (items, total_pages, total_count)
         """
-        # Calculate offset
-        offset = (page - 1) * limit
-        
-        # Get total count
-        total_count = db.query(self.model).filter(getattr(self.model, field) == value).count()
-        
-        # Calculate total pages
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        
-        # Get paginated results
-        items = db.query(self.model).filter(getattr(self.model, field) == value).offset(offset).limit(limit).all()
-        
-        return items, total_pages, total_count
+        return self._paginate(self.query(db).filter(self._column(field) == value), page, limit)
@@ -1,8 +1,9 @@
 from typing import List, Optional, Tuple
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.postgresql import Range
 from sqlalchemy.orm import Session, joinedload, noload
 from uuid import UUID
 from datetime import date
-import math
 from ..model.course import Course
 from ..model.worker import Worker
 from ..model.enrolling import Enrolling
@@ -16,14 +17,18 @@ class CourseRepository(BaseRepository[Course, CourseCreate, CourseUpdate]):
     def __init__(self):
         super().__init__(Course)
 
+    @staticmethod
+    def _insert_instructors(db: Session, course_id: UUID, worker_ids: List[UUID]) -> None:
+        """Insert the instructor rows of a course in a single multi-row INSERT"""
+        rows = [{'worker_id': worker_id, 'course_id': course_id} for worker_id in worker_ids]
+        if rows:
+            db.execute(insert(Instructor), rows)
+
     def create(self, db: Session, course: CourseCreate) -> Course:
         course_obj = Course(**course.model_dump(exclude={'instructors'}))
         db.add(course_obj)
-        course_obj.instructors = []
-        for instructor in course.instructors:
-            instructor_obj = Instructor(worker_id=instructor, course_id=course_obj.id)
-            db.add(instructor_obj)
-            course_obj.instructors.append(instructor_obj)
+        db.flush()
+        self._insert_instructors(db, course_obj.id, course.instructors)
         db.commit()
         db.refresh(course_obj)
         return course_obj
@@ -32,11 +37,13 @@ class CourseRepository(BaseRepository[Course, CourseCreate, CourseUpdate]):
         """
         Update a course and handle instructors relationship separately.
         """
-        # Get the update data and exclude instructors
-        obj_data = obj_in.model_dump(exclude_unset=True, exclude={'instructors'})
+        # Get the changed fields, excluding instructors
+        changes = self._changed_fields(db_obj, obj_in.model_dump(exclude_unset=True, exclude={'instructors'}))
+        if not changes and obj_in.instructors is None:
+            return db_obj
 
         # Update regular fields
-        for field, value in obj_data.items():
+        for field, value in changes.items():
             setattr(db_obj, field, value)
 
         # Handle instructors if provided
@@ -45,9 +52,7 @@ class CourseRepository(BaseRepository[Course, CourseCreate, CourseUpdate]):
             db.query(Instructor).filter(Instructor.course_id == db_obj.id).delete(synchronize_session=False)
 
             # Add new instructors
-            for instructor_id in obj_in.instructors:
-                instructor_obj = Instructor(worker_id=instructor_id, course_id=db_obj.id)
-                db.add(instructor_obj)
+            self._insert_instructors(db, db_obj.id, obj_in.instructors)
 
         db.add(db_obj)
         db.commit()
@@ -58,113 +63,69 @@ class CourseRepository(BaseRepository[Course, CourseCreate, CourseUpdate]):
         return db.query(Course).filter(Course.period_id == period_id).all()
 
     def get_by_type(self, db: Session, course_type: int) -> List[Course]:
-        return db.query(Course).filter(Course.type == course_type).all()
+        return db.query(Course).filter(Course.course_type == course_type).all()
 
     def get_by_mode(self, db: Session, mode: int) -> List[Course]:
-        return db.query(Course).filter(Course.mode == mode).all()
+        return db.query(Course).filter(Course.modality == mode).all()
 
     def get_by_profile(self, db: Session, profile: int) -> List[Course]:
-        return db.query(Course).filter(Course.profile == profile).all()
+        return db.query(Course).filter(Course.course_profile == profile).all()
 
     def get_by_date_range(self, db: Session, start_date: date, end_date: date) -> List[Course]:
         return db.query(Course).filter(
-            Course.start_date <= end_date,
-            Course.end_date >= start_date
+            Course.date_range.overlaps(Range(start_date, end_date, bounds="[]"))
         ).all()
 
     def get_active_courses(self, db: Session, current_date: date) -> List[Course]:
-        return db.query(Course).filter(
-            Course.start_date <= current_date,
-            Course.end_date >= current_date
-        ).all()
+        return db.query(Course).filter(Course.date_range.contains(current_date)).all()
 
     def search_by_name(self, db: Session, name: str) -> List[Course]:
-        return db.query(Course).filter(Course.name.ilike(f"%{name}%")).all()
+        return db.query(Course).filter(self._contains(Course.name, name)).all()
 
     def get_by_period_paginated(self, db: Session, period_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Course], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).filter(Course.period_id == period_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).filter(Course.period_id == period_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Course).filter(Course.period_id == period_id).order_by(Course.id), page, limit)
+
+    def get_by_period_after(self, db: Session, period_id: UUID, after: Optional[UUID], limit: int = 100) -> Tuple[List[Course], Optional[int], Optional[int]]:
+        return self._paginate_after(db.query(Course).filter(Course.period_id == period_id), after, limit)
 
     def get_by_type_paginated(self, db: Session, course_type: int, page: int = 1, limit: int = 100) -> Tuple[List[Course], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).filter(Course.type == course_type).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).filter(Course.type == course_type).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Course).filter(Course.course_type == course_type), page, limit)
 
     def get_by_mode_paginated(self, db: Session, mode: int, page: int = 1, limit: int = 100) -> Tuple[List[Course], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).filter(Course.mode == mode).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).filter(Course.mode == mode).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Course).filter(Course.modality == mode), page, limit)
 
     def get_by_profile_paginated(self, db: Session, profile: int, page: int = 1, limit: int = 100) -> Tuple[List[Course], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).filter(Course.profile == profile).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).filter(Course.profile == profile).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Course).filter(Course.course_profile == profile), page, limit)
 
     def get_by_date_range_paginated(self, db: Session, start_date: date, end_date: date, page: int = 1, limit: int = 100) -> Tuple[List[Course], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).filter(
-            Course.start_date <= end_date,
-            Course.end_date >= start_date
-        ).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).filter(
-            Course.start_date <= end_date,
-            Course.end_date >= start_date
-        ).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Course).filter(
+            Course.date_range.overlaps(Range(start_date, end_date, bounds="[]"))
+        ), page, limit)
 
     def get_active_courses_paginated(self, db: Session, current_date: date, page: int = 1, limit: int = 100) -> Tuple[List[Course], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).filter(
-            Course.start_date <= current_date,
-            Course.end_date >= current_date
-        ).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).filter(
-            Course.start_date <= current_date,
-            Course.end_date >= current_date
-        ).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Course).filter(Course.date_range.contains(current_date)), page, limit)
 
     def search_by_name_paginated(self, db: Session, name: str, page: int = 1, limit: int = 100) -> Tuple[List[Course], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).filter(Course.name.ilike(f"%{name}%")).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).filter(Course.name.ilike(f"%{name}%")).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Course).filter(self._contains(Course.name, name)), page, limit)
 
     def get_instructors(self, db: Session, courseId: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Worker], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Worker).join(Instructor, Instructor.worker_id == Worker.id).filter(Instructor.course_id == courseId).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Worker).join(Instructor, Instructor.worker_id == Worker.id).filter(Instructor.course_id == courseId).all()
-        return items, total_pages, total_count
+        return self._paginate(
+            db.query(Worker).join(Instructor, Instructor.worker_id == Worker.id).filter(Instructor.course_id == courseId).order_by(Worker.id),
+            page, limit
+        )
 
     def get_enrolled_workers(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Enrolling],int,int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Enrolling).filter(Enrolling.course_id == course_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Enrolling).options(joinedload(Enrolling.worker), noload(Enrolling.course)).filter(Enrolling.course_id == course_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(
+            db.query(Enrolling).options(joinedload(Enrolling.worker), noload(Enrolling.course)).filter(Enrolling.course_id == course_id),
+            page, limit
+        )
 
     def delete(self, db: Session, id: UUID) -> Optional[Course]:
         """
         Delete a course and all related records (instructors, enrollments, attendances) in cascade.
+        The course is deleted with DELETE ... RETURNING instead of being loaded first;
+        returns None if it does not exist.
         """
-        # Get the course first
-        course = db.query(Course).filter(Course.id == id).first()
-        if not course:
-            return None
-
         # Delete related instructors
         db.query(Instructor).filter(Instructor.course_id == id).delete(synchronize_session=False)
 
@@ -175,7 +136,10 @@ class CourseRepository(BaseRepository[Course, CourseCreate, CourseUpdate]):
         db.query(Enrolling).filter(Enrolling.course_id == id).delete(synchronize_session=False)
 
         # Finally, delete the course itself
-        db.delete(course)
+        course = db.execute(
+            delete(Course).where(Course.id == id).returning(Course),
+            execution_options={"synchronize_session": False}
+        ).scalar_one_or_none()
         db.commit()
 
-        return course
\ No newline at end of file
+        return course
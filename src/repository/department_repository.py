@@ -1,7 +1,7 @@
 from typing import List, Optional, Tuple
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from uuid import UUID
-import math
 from ..model.department import Department
 from ..model.worker import Worker
 from ..model.instructor import Instructor
@@ -9,6 +9,7 @@ from ..model.enrolling import Enrolling
 from ..model.attendance import Attendance
 from ..model.answer import Answer
 from ..dto.department import DepartmentCreate, DepartmentUpdate
+from ..utils.auth import invalidate_cached_worker
 from .base import BaseRepository
 
 
@@ -20,14 +21,10 @@ class DepartmentRepository(BaseRepository[Department, DepartmentCreate, Departme
         return db.query(Department).filter(Department.name == name).first()
 
     def search_by_name(self, db: Session, name: str) -> List[Department]:
-        return db.query(Department).filter(Department.name.ilike(f"%{name}%")).all()
+        return db.query(Department).filter(self._contains(Department.name, name)).all()
 
     def search_by_name_paginated(self, db: Session, name: str, page: int = 1, limit: int = 100) -> Tuple[List[Department], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Department).filter(Department.name.ilike(f"%{name}%")).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Department).filter(Department.name.ilike(f"%{name}%")).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Department).filter(self._contains(Department.name, name)), page, limit)
 
     def delete(self, db: Session, id: UUID) -> Optional[Department]:
         """
@@ -39,26 +36,23 @@ class DepartmentRepository(BaseRepository[Department, DepartmentCreate, Departme
         if not department:
             return None
 
-        # Get all workers in this department
-        worker_ids = db.query(Worker.id).filter(Worker.department_id == id).all()
-        worker_ids = [w[0] for w in worker_ids]
+        # Related records of every worker in this department, one statement per table
+        worker_ids = db.query(Worker.id).filter(Worker.department_id == id).scalar_subquery()
+        db.query(Answer).filter(Answer.worker_id.in_(worker_ids)).delete(synchronize_session=False)
+        db.query(Attendance).filter(Attendance.worker_id.in_(worker_ids)).delete(synchronize_session=False)
+        db.query(Enrolling).filter(Enrolling.worker_id.in_(worker_ids)).delete(synchronize_session=False)
+        db.query(Instructor).filter(Instructor.worker_id.in_(worker_ids)).delete(synchronize_session=False)
 
-        # For each worker, delete their related records
-        for worker_id in worker_ids:
-            # Delete worker's answers
-            db.query(Answer).filter(Answer.worker_id == worker_id).delete(synchronize_session=False)
-            # Delete worker's attendances
-            db.query(Attendance).filter(Attendance.worker_id == worker_id).delete(synchronize_session=False)
-            # Delete worker's enrollments
-            db.query(Enrolling).filter(Enrolling.worker_id == worker_id).delete(synchronize_session=False)
-            # Delete worker's instructor records
-            db.query(Instructor).filter(Instructor.worker_id == worker_id).delete(synchronize_session=False)
-
-        # Delete all workers in this department
-        db.query(Worker).filter(Worker.department_id == id).delete(synchronize_session=False)
+        # Delete all workers in this department, keeping their ids to drop them from the auth cache
+        deleted_worker_ids = db.execute(
+            delete(Worker).where(Worker.department_id == id).returning(Worker.id),
+            execution_options={"synchronize_session": False}
+        ).scalars().all()
 
         # Finally, delete the department itself
         db.delete(department)
         db.commit()
+        for worker_id in deleted_worker_ids:
+            invalidate_cached_worker(worker_id)
 
         return department
@@ -1,8 +1,9 @@
-from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session, joinedload, noload
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Numeric, column, lambda_stmt, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session, joinedload, noload, selectinload
 from uuid import UUID
 from decimal import Decimal
-import math
 from ..model.enrolling import Enrolling
 from ..dto.enrolling import EnrollingCreate, EnrollingUpdate
 from .base import BaseRepository
@@ -12,61 +13,93 @@ class EnrollingRepository(BaseRepository[Enrolling, EnrollingCreate, EnrollingUp
     def __init__(self):
         super().__init__(Enrolling)
 
+    def load_options(self) -> Tuple:
+        # The Enrolling DTO nests the worker and the course; load both in one batched query each
+        return (selectinload(Enrolling.worker), selectinload(Enrolling.course))
+
+    def bulk_update_grades(self, db: Session, course_id: UUID, grades: Dict[UUID, Decimal]) -> List[UUID]:
+        """
+        Set the final grade of many enrollments of a course in a single UPDATE ... FROM (VALUES ...).
+        Returns the ids of the workers whose enrollment was updated; the rest are not enrolled.
+        """
+        if not grades:
+            return []
+        grade_values = values(
+            column("worker_id", PG_UUID(as_uuid=True)),
+            column("final_grade", Numeric(5, 2)),
+            name="grades"
+        ).data(list(grades.items()))
+        stmt = update(Enrolling).where(
+            Enrolling.course_id == course_id,
+            Enrolling.worker_id == grade_values.c.worker_id
+        ).values(final_grade=grade_values.c.final_grade).returning(Enrolling.worker_id)
+        updated = db.execute(stmt, execution_options={"synchronize_session": False}).scalars().all()
+        db.commit()
+        return updated
+
+    # The loader options are spelled out because a lambda statement cannot call load_options()
     def get_by_worker(self, db: Session, worker_id: UUID) -> List[Enrolling]:
-        return db.query(Enrolling).filter(Enrolling.worker_id == worker_id).all()
+        stmt = lambda_stmt(lambda: select(Enrolling).options(
+            selectinload(Enrolling.worker), selectinload(Enrolling.course)
+        ).where(Enrolling.worker_id == worker_id))
+        return db.execute(stmt).scalars().all()
 
     def get_by_course(self, db: Session, course_id: UUID) -> List[Enrolling]:
-        return db.query(Enrolling).filter(Enrolling.course_id == course_id).all()
+        stmt = lambda_stmt(lambda: select(Enrolling).options(
+            selectinload(Enrolling.worker), selectinload(Enrolling.course)
+        ).where(Enrolling.course_id == course_id))
+        return db.execute(stmt).scalars().all()
 
     def get_by_worker_and_course(self, db: Session, worker_id: UUID, course_id: UUID) -> Optional[Enrolling]:
-        return db.query(Enrolling).filter(
+        stmt = lambda_stmt(lambda: select(Enrolling).where(
+            Enrolling.worker_id == worker_id,
+            Enrolling.course_id == course_id
+        ))
+        return db.execute(stmt).scalars().first()
+
+    def exists_by_worker_and_course(self, db: Session, worker_id: UUID, course_id: UUID, exclude_id: Optional[UUID] = None) -> bool:
+        """Whether the worker is already enrolled in the course, ignoring exclude_id"""
+        query = db.query(Enrolling.id).filter(
             Enrolling.worker_id == worker_id,
             Enrolling.course_id == course_id
-        ).first()
+        )
+        if exclude_id is not None:
+            query = query.filter(Enrolling.id != exclude_id)
+        return db.query(query.exists()).scalar()
 
     def get_by_grade_range(self, db: Session, min_grade: Decimal, max_grade: Decimal) -> List[Enrolling]:
-        return db.query(Enrolling).filter(
+        stmt = lambda_stmt(lambda: select(Enrolling).options(
+            selectinload(Enrolling.worker), selectinload(Enrolling.course)
+        ).where(
             Enrolling.final_grade >= min_grade,
             Enrolling.final_grade <= max_grade
-        ).all()
+        ))
+        return db.execute(stmt).scalars().all()
 
     def get_enrolled_workers(self, db: Session, course_id: UUID) -> List[Enrolling]:
-        return db.query(Enrolling).filter(Enrolling.course_id == course_id).all()
+        return self.get_by_course(db, course_id)
 
     def get_worker_enrollments(self, db: Session, worker_id: UUID) -> List[Enrolling]:
-        return db.query(Enrolling).filter(Enrolling.worker_id == worker_id).all()
+        return self.get_by_worker(db, worker_id)
 
     def get_by_worker_paginated(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Enrolling], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Enrolling).filter(Enrolling.worker_id == worker_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Enrolling).filter(Enrolling.worker_id == worker_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(self.query(db).filter(Enrolling.worker_id == worker_id).order_by(Enrolling.id), page, limit)
+
+    def get_by_worker_after(self, db: Session, worker_id: UUID, after: Optional[UUID], limit: int = 100) -> Tuple[List[Enrolling], Optional[int], Optional[int]]:
+        return self._paginate_after(self.query(db).filter(Enrolling.worker_id == worker_id), after, limit)
 
     def get_by_course_paginated(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Enrolling], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Enrolling).filter(Enrolling.course_id == course_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Enrolling).filter(Enrolling.course_id == course_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(self.query(db).filter(Enrolling.course_id == course_id).order_by(Enrolling.id), page, limit)
+
+    def get_by_course_after(self, db: Session, course_id: UUID, after: Optional[UUID], limit: int = 100) -> Tuple[List[Enrolling], Optional[int], Optional[int]]:
+        return self._paginate_after(self.query(db).filter(Enrolling.course_id == course_id), after, limit)
 
     def get_by_grade_range_paginated(self, db: Session, min_grade: Decimal, max_grade: Decimal, page: int = 1, limit: int = 100) -> Tuple[List[Enrolling], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Enrolling).filter(
-            Enrolling.final_grade >= min_grade,
-            Enrolling.final_grade <= max_grade
-        ).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Enrolling).filter(
+        return self._paginate(self.query(db).filter(
             Enrolling.final_grade >= min_grade,
             Enrolling.final_grade <= max_grade
-        ).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        ), page, limit)
 
     def get_enrolled_workers_paginated(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Enrolling], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Enrolling).filter(Enrolling.course_id == course_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Enrolling).filter(Enrolling.course_id == course_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(self.query(db).filter(Enrolling.course_id == course_id), page, limit)
     
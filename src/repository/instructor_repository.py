@@ -1,8 +1,7 @@
 from typing import List, Optional, Tuple
-from sqlalchemy import delete
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, lambda_stmt, select
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
-import math
 from ..model.instructor import Instructor
 from ..model.course import Course
 from ..model.worker import Worker
@@ -15,29 +14,44 @@ class InstructorRepository(BaseRepository[Instructor, InstructorCreate, Instruct
         super().__init__(Instructor)
 
     def get_by_worker(self, db: Session, worker_id: UUID) -> List[Instructor]:
-        return db.query(Instructor).filter(Instructor.worker_id == worker_id).all()
+        # The instructor courses report reads each course
+        stmt = lambda_stmt(lambda: select(Instructor).options(selectinload(Instructor.course)).where(Instructor.worker_id == worker_id))
+        return db.execute(stmt).scalars().all()
 
     def get_by_course(self, db: Session, course_id: UUID) -> List[Instructor]:
-        return db.query(Instructor).filter(Instructor.course_id == course_id).all()
+        stmt = lambda_stmt(lambda: select(Instructor).where(Instructor.course_id == course_id))
+        return db.execute(stmt).scalars().all()
 
     def get_by_worker_and_course(self, db: Session, worker_id: UUID, course_id: UUID) -> Optional[Instructor]:
-        return db.query(Instructor).filter(
+        stmt = lambda_stmt(lambda: select(Instructor).where(
             Instructor.worker_id == worker_id,
             Instructor.course_id == course_id
-        ).first()
+        ))
+        return db.execute(stmt).scalars().first()
+
+    def exists_by_worker_and_course(self, db: Session, worker_id: UUID, course_id: UUID, exclude_id: Optional[UUID] = None) -> bool:
+        """Whether the worker is already an instructor of the course, ignoring exclude_id"""
+        query = db.query(Instructor.id).filter(
+            Instructor.worker_id == worker_id,
+            Instructor.course_id == course_id
+        )
+        if exclude_id is not None:
+            query = query.filter(Instructor.id != exclude_id)
+        return db.query(query.exists()).scalar()
 
     def get_courses_by_worker(self, db: Session, worker_id: UUID) -> List[Instructor]:
-        return db.query(Instructor).filter(Instructor.worker_id == worker_id).all()
+        return self.get_by_worker(db, worker_id)
 
     def get_workers_by_course(self, db: Session, course_id: UUID) -> List[Instructor]:
-        return db.query(Instructor).filter(Instructor.course_id == course_id).all()
+        return self.get_by_course(db, course_id)
     
     def check_instructor_list(self, db: Session, instructors: List[UUID]) -> bool:
         unique_instructor_ids = set(instructors)
         expected_count = len(unique_instructor_ids)
-        found_count = db.query(Worker).filter(
+        # count(id) straight off the primary key instead of counting a SELECT of every worker column
+        found_count = db.query(func.count(Worker.id)).filter(
             Worker.id.in_(unique_instructor_ids)
-        ).count()
+        ).scalar()
         return expected_count == found_count
 
     def check_availability(self, db: Session, worker_list: List[UUID], start_date: date, end_date: date, start_time: time, end_time: time, exclude_course_id: Optional[UUID] = None) -> bool:
@@ -49,7 +63,7 @@ class InstructorRepository(BaseRepository[Instructor, InstructorCreate, Instruct
         - Date ranges overlap: new_start <= existing_end AND new_end >= existing_start
         - AND time ranges overlap: new_start_time < existing_end_time AND new_end_time > existing_start_time
         """
-        query = db.query(Instructor).join(Course).filter(
+        query = db.query(Instructor.id).join(Course).filter(
             Instructor.worker_id.in_(worker_list),
             # Date overlap: new course dates overlap with existing course dates
             Course.start_date <= end_date,
@@ -63,34 +77,23 @@ class InstructorRepository(BaseRepository[Instructor, InstructorCreate, Instruct
         if exclude_course_id is not None:
             query = query.filter(Course.id != exclude_course_id)
 
-        # If count > 0, there's a conflict (not available)
-        # If count == 0, no conflicts (available)
-        return query.count() == 0
+        # Any conflicting row means not available; EXISTS stops at the first one
+        return not db.query(query.exists()).scalar()
 
     def get_by_worker_paginated(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Instructor], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Instructor).filter(Instructor.worker_id == worker_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Instructor).filter(Instructor.worker_id == worker_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Instructor).filter(Instructor.worker_id == worker_id).order_by(Instructor.id), page, limit)
+
+    def get_by_worker_after(self, db: Session, worker_id: UUID, after: Optional[UUID], limit: int = 100) -> Tuple[List[Instructor], Optional[int], Optional[int]]:
+        return self._paginate_after(db.query(Instructor).filter(Instructor.worker_id == worker_id), after, limit)
 
     def get_by_course_paginated(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Instructor], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Instructor).filter(Instructor.course_id == course_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Instructor).filter(Instructor.course_id == course_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Instructor).filter(Instructor.course_id == course_id).order_by(Instructor.id), page, limit)
+
+    def get_by_course_after(self, db: Session, course_id: UUID, after: Optional[UUID], limit: int = 100) -> Tuple[List[Instructor], Optional[int], Optional[int]]:
+        return self._paginate_after(db.query(Instructor).filter(Instructor.course_id == course_id), after, limit)
 
     def get_courses_by_worker_paginated(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Instructor], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Instructor).filter(Instructor.worker_id == worker_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Instructor).filter(Instructor.worker_id == worker_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self.get_by_worker_paginated(db, worker_id, page, limit)
 
     def get_workers_by_course_paginated(self, db: Session, course_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Instructor], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Instructor).filter(Instructor.course_id == course_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Instructor).filter(Instructor.course_id == course_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self.get_by_course_paginated(db, course_id, page, limit)
@@ -1,7 +1,8 @@
 from typing import List, Optional, Tuple
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from uuid import UUID
-import math
 from ..model.question import Question
 from ..model.answer import Answer
 from ..dto.question import QuestionCreate, QuestionUpdate
@@ -12,31 +13,37 @@ class QuestionRepository(BaseRepository[Question, QuestionCreate, QuestionUpdate
     def __init__(self):
         super().__init__(Question)
 
+    def create_if_order_free(self, db: Session, obj_in: QuestionCreate) -> Optional[Question]:
+        """
+        Insert a question unless its survey already has one at the same order.
+        Returns None on conflict; the unique constraint makes the check race-free.
+        """
+        stmt = insert(Question).values(**obj_in.model_dump()).on_conflict_do_nothing(
+            index_elements=['survey_id', 'question_order']
+        ).returning(Question)
+        question = db.execute(stmt).scalar_one_or_none()
+        db.commit()
+        return question
+
     def get_by_survey(self, db: Session, survey_id: UUID) -> List[Question]:
         return db.query(Question).filter(Question.survey_id == survey_id).order_by(Question.question_order).all()
 
     def get_by_order(self, db: Session, survey_id: UUID, question_order: int) -> Optional[Question]:
-        return db.query(Question).filter(
+        # At most one row through unique_survey_question_order, so no LIMIT is needed
+        stmt = lambda_stmt(lambda: select(Question).where(
             Question.survey_id == survey_id,
             Question.question_order == question_order
-        ).first()
+        ))
+        return db.execute(stmt).scalar_one_or_none()
 
     def search_by_text(self, db: Session, text: str) -> List[Question]:
-        return db.query(Question).filter(Question.question.ilike(f"%{text}%")).all()
+        return db.query(Question).filter(self._contains(Question.question, text)).all()
 
     def get_by_survey_paginated(self, db: Session, survey_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Question], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Question).filter(Question.survey_id == survey_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Question).filter(Question.survey_id == survey_id).order_by(Question.question_order).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Question).filter(Question.survey_id == survey_id).order_by(Question.question_order), page, limit)
 
     def search_by_text_paginated(self, db: Session, text: str, page: int = 1, limit: int = 100) -> Tuple[List[Question], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Question).filter(Question.question.ilike(f"%{text}%")).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Question).filter(Question.question.ilike(f"%{text}%")).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Question).filter(self._contains(Question.question, text)), page, limit)
 
     def delete(self, db: Session, id: UUID) -> Optional[Question]:
         """
@@ -1,8 +1,7 @@
-from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session, joinedload, noload
-from sqlalchemy import exists
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from sqlalchemy.orm import Query, Session, joinedload, load_only, noload
+from sqlalchemy import func, lambda_stmt, select
 from uuid import UUID
-import math
 from ..model.worker import Worker
 from ..model.instructor import Instructor
 from ..model.enrolling import Enrolling
@@ -10,6 +9,7 @@ from ..model.course import Course
 from ..model.attendance import Attendance
 from ..model.answer import Answer
 from ..dto.worker import WorkerCreate, WorkerUpdate
+from ..utils.auth import invalidate_cached_worker
 from .base import BaseRepository
 from datetime import date, time
 
@@ -18,17 +18,42 @@ class WorkerRepository(BaseRepository[Worker, WorkerCreate, WorkerUpdate]):
     def __init__(self):
         super().__init__(Worker)
 
+    def summary_query(self, db: Session) -> Query:
+        """Workers with only the columns of the WorkerSummary DTO loaded"""
+        return db.query(Worker).options(load_only(
+            Worker.id, Worker.name, Worker.father_surname, Worker.mother_surname, Worker.email, Worker.position
+        ))
+
+    def get_summaries_paginated(self, db: Session, page: int = 1, limit: int = 100) -> Tuple[List[Worker], int, int]:
+        return self._paginate(self.summary_query(db).order_by(Worker.id), page, limit)
+
+    def get_summaries_after(self, db: Session, after: Optional[UUID], limit: int = 100) -> Tuple[List[Worker], Optional[int], Optional[int]]:
+        return self._paginate_after(self.summary_query(db), after, limit)
+
     def get_by_id(self, db: Session, id: UUID):
-        return db.query(Worker).get(id)
+        return self.get(db, id)
+
+    def get_with_department(self, db: Session, id: UUID) -> Optional[Worker]:
+        return db.query(Worker).options(joinedload(Worker.department)).filter(Worker.id == id).first()
+
+    def update(self, db: Session, db_obj: Worker, obj_in: Union[WorkerUpdate, Dict[str, Any]]) -> Worker:
+        worker = super().update(db, db_obj, obj_in)
+        invalidate_cached_worker(worker.id)
+        return worker
 
     def get_by_email(self, db: Session, email: str) -> Optional[Worker]:
-        return db.query(Worker).filter(Worker.email == email).first()
+        email = email.lower()
+        # Matches the workers_email_lower_idx functional index
+        stmt = lambda_stmt(lambda: select(Worker).where(func.lower(Worker.email) == email))
+        return db.execute(stmt).scalars().first()
 
     def get_by_rfc(self, db: Session, rfc: str) -> Optional[Worker]:
-        return db.query(Worker).filter(Worker.rfc == rfc).first()
+        stmt = lambda_stmt(lambda: select(Worker).where(Worker.rfc == rfc))
+        return db.execute(stmt).scalars().first()
 
     def get_by_curp(self, db: Session, curp: str) -> Optional[Worker]:
-        return db.query(Worker).filter(Worker.curp == curp).first()
+        stmt = lambda_stmt(lambda: select(Worker).where(Worker.curp == curp))
+        return db.execute(stmt).scalars().first()
 
     def get_by_department(self, db: Session, department_id: UUID) -> List[Worker]:
         return db.query(Worker).filter(Worker.department_id == department_id).all()
@@ -37,82 +62,52 @@ class WorkerRepository(BaseRepository[Worker, WorkerCreate, WorkerUpdate]):
         return db.query(Worker).filter(Worker.position == position).all()
 
     def search_by_name(self, db: Session, name: str) -> List[Worker]:
-        return db.query(Worker).filter(
-            Worker.name.ilike(f"%{name}%") |
-            Worker.father_surname.ilike(f"%{name}%") |
-            Worker.mother_surname.ilike(f"%{name}%")
-        ).all()
+        return db.query(Worker).filter(self._contains(Worker.full_name, name)).all()
 
     def check_worker_list(self, db: Session, worker_list: List[UUID]) -> bool:
-        return db.query(Worker).filter(Worker.id.in_(worker_list)).count() == len(worker_list)
+        unique_ids = set(worker_list)
+        return db.query(func.count(Worker.id)).filter(Worker.id.in_(unique_ids)).scalar() == len(unique_ids)
+
+    def get_existing_ids(self, db: Session, worker_ids: List[UUID]) -> Set[UUID]:
+        """Subset of the given ids that belong to existing workers"""
+        return {row.id for row in db.query(Worker.id).filter(Worker.id.in_(worker_ids))}
 
     def get_by_availability_paginated(self, db: Session, start_date: date, end_date: date, start_time: time, end_time: time, page: int = 1, limit: int = 100) -> Tuple[List[Worker], int, int]:
-        offset = (page - 1) * limit
+        # Correlated on the worker; same overlap test as InstructorRepository.check_availability,
+        # where course dates are inclusive and times are half-open
         subquery = (
             db.query(Instructor)
             .join(Course)
             .filter(
                 Instructor.worker_id == Worker.id,
-                Course.start_date < end_date,
-                Course.end_date > start_date,
+                Course.start_date <= end_date,
+                Course.end_date >= start_date,
                 Course.start_time < end_time,
                 Course.end_time > start_time
             )
         )
-        total_count = db.query(Worker).filter(~exists(subquery)).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Worker).filter(~exists(subquery)).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(db.query(Worker).filter(~subquery.exists()), page, limit)
 
     def get_by_department_paginated(self, db: Session, department_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Worker], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Worker).filter(Worker.department_id == department_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Worker).filter(Worker.department_id == department_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(self.summary_query(db).filter(Worker.department_id == department_id).order_by(Worker.id), page, limit)
 
     def get_by_position_paginated(self, db: Session, position: int, page: int = 1, limit: int = 100) -> Tuple[List[Worker], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Worker).filter(Worker.position == position).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Worker).filter(Worker.position == position).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(self.summary_query(db).filter(Worker.position == position).order_by(Worker.id), page, limit)
 
     def search_by_name_paginated(self, db: Session, name: str, page: int = 1, limit: int = 100) -> Tuple[List[Worker], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Worker).filter(
-            Worker.name.ilike(f"%{name}%") |
-            Worker.father_surname.ilike(f"%{name}%") |
-            Worker.mother_surname.ilike(f"%{name}%")
-        ).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Worker).filter(
-            Worker.name.ilike(f"%{name}%") |
-            Worker.father_surname.ilike(f"%{name}%") |
-            Worker.mother_surname.ilike(f"%{name}%")
-        ).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        return self._paginate(self.summary_query(db).filter(self._contains(Worker.full_name, name)), page, limit)
 
     def get_teaching_courses(self, db: Session, instructor: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Course],int,int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).join(Instructor, Course.id == Instructor.course_id).filter(Instructor.worker_id == instructor).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).join(Instructor).filter(Course.id == Instructor.course_id).filter(Instructor.worker_id == instructor).all()
-        return items, total_pages, total_count
-    
+        query = db.query(Course).join(Instructor, Course.id == Instructor.course_id).filter(Instructor.worker_id == instructor)
+        return self._paginate(query, page, limit)
+
     def get_enrolled_courses(self, db: Session, instructor: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Course],int,int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Course).join(Enrolling, Course.id == Enrolling.course_id).filter(Enrolling.worker_id == instructor).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Course).join(Enrolling, Course.id == Enrolling.course_id).filter(Enrolling.worker_id == instructor).all()
-        return items, total_pages, total_count
-    
+        query = db.query(Course).join(Enrolling, Course.id == Enrolling.course_id).filter(Enrolling.worker_id == instructor)
+        return self._paginate(query, page, limit)
+
     def get_enrollments(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Enrolling], int, int]:
-        offset = (page - 1) * limit
-        total_count = db.query(Enrolling).filter(Enrolling.worker_id == worker_id).count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = db.query(Enrolling).options(joinedload(Enrolling.course), noload(Enrolling.worker)).filter(Enrolling.worker_id == worker_id).offset(offset).limit(limit).all()
-        return items, total_pages, total_count
+        query = db.query(Enrolling).options(joinedload(Enrolling.course), noload(Enrolling.worker)).filter(Enrolling.worker_id == worker_id)
+        return self._paginate(query, page, limit)
 
     def get_available_courses(self, db: Session, worker_id: UUID, page: int = 1, limit: int = 100) -> Tuple[List[Course], int, int]:
         """
@@ -122,31 +117,29 @@ class WorkerRepository(BaseRepository[Worker, WorkerCreate, WorkerUpdate]):
         - Courses that have already started (start_date <= today)
         - Courses where the worker is already enrolled
         """
-        offset = (page - 1) * limit
         today = date.today()
 
-        # Subquery for courses where worker is an instructor
-        instructor_subquery = db.query(Instructor.course_id).filter(
+        # Correlated subquery for courses where worker is an instructor
+        instructor_subquery = db.query(Instructor).filter(
+            Instructor.course_id == Course.id,
             Instructor.worker_id == worker_id
         )
 
-        # Subquery for courses where worker is already enrolled
-        enrolled_subquery = db.query(Enrolling.course_id).filter(
+        # Correlated subquery for courses where worker is already enrolled
+        enrolled_subquery = db.query(Enrolling).filter(
+            Enrolling.course_id == Course.id,
             Enrolling.worker_id == worker_id
         )
 
         # Main query: courses with start_date > today, worker is not instructor, and worker is not enrolled
+        # NOT EXISTS plans as an anti-join on the (worker_id, course_id) unique indexes, unlike NOT IN
         base_query = db.query(Course).filter(
             Course.start_date > today,
-            ~Course.id.in_(instructor_subquery),
-            ~Course.id.in_(enrolled_subquery)
+            ~instructor_subquery.exists(),
+            ~enrolled_subquery.exists()
         )
 
-        total_count = base_query.count()
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
-        items = base_query.offset(offset).limit(limit).all()
-
-        return items, total_pages, total_count
+        return self._paginate(base_query, page, limit)
 
     def delete(self, db: Session, id: UUID) -> Optional[Worker]:
         """
@@ -154,7 +147,7 @@ class WorkerRepository(BaseRepository[Worker, WorkerCreate, WorkerUpdate]):
         Deletes: instructors, enrollments, attendances, and answers
         """
         # Get the worker first
-        worker = db.query(Worker).filter(Worker.id == id).first()
+        worker = self.get(db, id)
         if not worker:
             return None
 
@@ -173,5 +166,6 @@ class WorkerRepository(BaseRepository[Worker, WorkerCreate, WorkerUpdate]):
         # Finally, delete the worker itself
         db.delete(worker)
         db.commit()
+        invalidate_cached_worker(id)
 
         return worker
\ No newline at end of file
@@ -17,6 +17,7 @@ from uuid import UUID
 from datetime import timedelta
 
 from ..model.course import Course
+from ..model.enums import WorkerRole
 from ..model.worker import Worker
 from ..model.enrolling import Enrolling
 from ..model.answer import Answer
@@ -31,6 +32,16 @@ from ..repository.instructor_repository import InstructorRepository
 from ..repository.attendance_repository import AttendanceRepository
 
 
+ROLE_LABELS = {
+    WorkerRole.TEACHER: 'Docente',
+    WorkerRole.DEPT_HEAD: 'Jefe de Departamento',
+}
+
+
+class ReportNotFoundError(ValueError):
+    """Raised when an entity a report depends on does not exist"""
+
+
 class PDFReportService:
     """Service for generating PDF reports"""
 
@@ -89,14 +100,11 @@ class PDFReportService:
         # Fetch course data
         course = self.course_repo.get(db, course_id)
         if not course:
-            raise ValueError(f"Course with ID {course_id} not found")
+            raise ReportNotFoundError(f"Course with ID {course_id} not found")
 
         # Fetch enrollments
         enrollments = self.enrolling_repo.get_by_course(db, course_id)
 
-        # Fetch all attendance records for this course
-        all_attendances = self.attendance_repo.get_by_course(db, course_id)
-
         # Generate list of all course days
         course_days = []
         if course.start_date and course.end_date:
@@ -105,12 +113,12 @@ class PDFReportService:
                 course_days.append(current_date)
                 current_date += timedelta(days=1)
 
-        # Create attendance lookup: {worker_id: {date: True}}
+        # Create attendance lookup: {worker_id: {date: True}}, streamed from the course attendances
         attendance_lookup = {}
-        for attendance in all_attendances:
-            if attendance.worker_id not in attendance_lookup:
-                attendance_lookup[attendance.worker_id] = {}
-            attendance_lookup[attendance.worker_id][attendance.attendance_date] = True
+        for worker_id, attendance_date in self.attendance_repo.iter_dates_by_course(db, course_id):
+            if worker_id not in attendance_lookup:
+                attendance_lookup[worker_id] = {}
+            attendance_lookup[worker_id][attendance_date] = True
 
         # Determine if we need landscape orientation (if many days)
         use_landscape = len(course_days) > 10
@@ -234,7 +242,7 @@ class PDFReportService:
         # Fetch course data
         course = self.course_repo.get(db, course_id)
         if not course:
-            raise ValueError(f"Course with ID {course_id} not found")
+            raise ReportNotFoundError(f"Course with ID {course_id} not found")
 
         # Fetch enrollments
         enrollments = self.enrolling_repo.get_by_course(db, course_id)
@@ -327,19 +335,18 @@ class PDFReportService:
         Includes: worker info, course info, enrollment date
         """
         # Fetch data
-        worker = self.worker_repo.get(db, worker_id)
+        worker = self.worker_repo.get_with_department(db, worker_id)
         if not worker:
-            raise ValueError(f"Worker with ID {worker_id} not found")
+            raise ReportNotFoundError(f"Worker with ID {worker_id} not found")
 
         course = self.course_repo.get(db, course_id)
         if not course:
-            raise ValueError(f"Course with ID {course_id} not found")
+            raise ReportNotFoundError(f"Course with ID {course_id} not found")
 
-        # Get enrollment
-        enrollments = self.enrolling_repo.get_by_worker(db, worker_id)
-        enrollment = next((e for e in enrollments if e.course_id == course_id), None)
+        # Get enrollment; a single row through the worker/course unique constraint
+        enrollment = self.enrolling_repo.get_by_worker_and_course(db, worker_id, course_id)
         if not enrollment:
-            raise ValueError(f"Enrollment not found for worker {worker_id} in course {course_id}")
+            raise ReportNotFoundError(f"Enrollment not found for worker {worker_id} in course {course_id}")
 
         # Create PDF buffer
         buffer = BytesIO()
@@ -364,7 +371,7 @@ class PDFReportService:
             ['Teléfono', worker.telephone or 'N/A'],
             ['Sexo', 'Masculino' if worker.sex == 1 else 'Femenino' if worker.sex == 0 else 'N/A'],
             ['Departamento', worker.department.name if worker.department else 'N/A'],
-            ['Rol', 'Jefe de Departamento' if worker.position == 0 else 'Docente' if worker.role == 1 else 'N/A'],
+            ['Rol', ROLE_LABELS.get(worker.role, 'N/A')],
         ]
 
         worker_table = Table(worker_data, colWidths=[2*inch, 4.5*inch])
@@ -463,9 +470,9 @@ class PDFReportService:
         Includes: all course information for each course
         """
         # Fetch worker
-        worker = self.worker_repo.get(db, worker_id)
+        worker = self.worker_repo.get_with_department(db, worker_id)
         if not worker:
-            raise ValueError(f"Worker with ID {worker_id} not found")
+            raise ReportNotFoundError(f"Worker with ID {worker_id} not found")
 
         # Get instructor records
         instructor_records = self.instructor_repo.get_by_worker(db, worker_id)
@@ -558,17 +565,17 @@ class PDFReportService:
         # Fetch data
         worker = self.worker_repo.get(db, worker_id)
         if not worker:
-            raise ValueError(f"Worker with ID {worker_id} not found")
+            raise ReportNotFoundError(f"Worker with ID {worker_id} not found")
 
         course = self.course_repo.get(db, course_id)
         if not course:
-            raise ValueError(f"Course with ID {course_id} not found")
+            raise ReportNotFoundError(f"Course with ID {course_id} not found")
 
         # Get answers
         answers = self.answer_repo.get_by_worker_survey_and_course(db, worker_id, survey_id, course_id)
 
         if not answers:
-            raise ValueError(f"No answers found for this survey")
+            raise ReportNotFoundError(f"No answers found for this survey")
 
         # Create PDF buffer
         buffer = BytesIO()
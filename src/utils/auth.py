@@ -1,9 +1,15 @@
+import hashlib
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+from uuid import UUID
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 import os
 from dotenv import load_dotenv
+from src.model.enums import WorkerRole
+from src.utils.cache import TTLCache
 
 load_dotenv()
 
@@ -11,11 +17,39 @@ load_dotenv()
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# Segundos que se reutiliza la identidad de un worker autenticado sin consultar la BD (0 = sin caché)
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "30"))
 
 # Contexto para hash de contraseñas
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+@dataclass(frozen=True)
+class CachedWorker:
+    """
+    Identidad mínima del worker autenticado, desacoplada de la sesión de SQLAlchemy
+    """
+    id: UUID
+    position: int
+    department_id: Optional[UUID]
+
+    @property
+    def role(self) -> Optional[WorkerRole]:
+        return WorkerRole(self.position) if self.position in WorkerRole._value2member_map_ else None
+
+
+# Caché de identidades por worker_id; se invalida al actualizar o eliminar el worker
+worker_cache = TTLCache(maxsize=10_000, default_ttl=AUTH_CACHE_TTL_SECONDS)
+
+
+def invalidate_cached_worker(worker_id: UUID) -> None:
+    worker_cache.pop(worker_id)
+
+
+# Payloads de tokens ya verificados, indexados por un hash del token (nunca el token en claro)
+token_cache = TTLCache(maxsize=50_000, default_ttl=60)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifica si una contraseña en texto plano coincide con el hash
@@ -67,3 +101,23 @@ def decode_access_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+def decode_access_token_cached(token: str) -> Optional[dict]:
+    """
+    Igual que decode_access_token, pero reutiliza la verificación de la firma
+    mientras el token siga vigente (máximo 60 segundos)
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+
+    ttl = min(token_cache.default_ttl, payload.get("exp", 0) - time.time())
+    if ttl > 0:
+        token_cache.set(key, payload, ttl=ttl)
+    return payload
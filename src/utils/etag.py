@@ -0,0 +1,28 @@
+import hashlib
+from typing import Any, Iterable, Optional
+from sqlalchemy import inspect
+
+
+def compute_etag(obj: Any, exclude: Iterable[str] = ()) -> str:
+    """
+    Weak ETag fingerprinting the column values of an ORM object.
+    Any change to an included column yields a different tag.
+    """
+    excluded = set(exclude)
+    values = tuple(
+        getattr(obj, attr.key)
+        for attr in inspect(obj).mapper.column_attrs
+        if attr.key not in excluded
+    )
+    digest = hashlib.blake2b(repr(values).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches the ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
@@ -0,0 +1,48 @@
+import base64
+from typing import Any, List, Optional
+from uuid import UUID
+from fastapi import HTTPException, Query, status
+
+
+def encode_cursor(id: UUID) -> str:
+    """Opaque keyset cursor for the row with the given id"""
+    return base64.urlsafe_b64encode(id.bytes).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> UUID:
+    """
+    Id encoded in a keyset cursor
+    Raises ValueError if the cursor is malformed
+    """
+    try:
+        return UUID(bytes=base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def next_cursor(items: List[Any], limit: int) -> Optional[str]:
+    """
+    Cursor to the page after items, or None if this was the last page
+    Returned as `next_cursor`; passed back as `after`, it continues the list by keyset (see after_cursor)
+    """
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(items[-1].id)
+
+
+def after_cursor(after: Optional[str] = Query(None, description="`next_cursor` of a previous page, to continue the list by keyset")) -> Optional[UUID]:
+    """
+    Dependency reading the `after` keyset cursor of a list endpoint
+    With `after`, the endpoint returns the rows that follow the cursor in id order instead of an
+    OFFSET page: `page` is ignored and total_pages/total_count are None (the first page carries them)
+    Raises HTTPException 400 if the cursor is malformed
+    """
+    if after is None:
+        return None
+    try:
+        return decode_cursor(after)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )